@@ -0,0 +1,5 @@
+from crdlib.exceptions.exceptions import CRDLibException
+
+
+class UndefinedThermalCapacityCoefficient(CRDLibException):
+    description = "thermal capacity coefficients have not been defined for a chemical reaction participant. "
@@ -0,0 +1,24 @@
+from typing import Iterable
+
+from crdlib.chemical_reactions.reaction import ChemicalReaction
+from crdlib.properties.properties import Temperature
+
+
+class ChemicalReactionNetwork:
+    """
+    A set of chemical reactions that are evaluated together, e.g. all reactions
+    taking place in a reactor.
+    """
+
+    def __init__(self, reactions: Iterable[ChemicalReaction]) -> None:
+        self.reactions = tuple(reactions)
+
+    def equilibrium_constants(
+        self, temperatures: Iterable[Temperature]
+    ) -> list[list[float]]:
+        """
+        Equilibrium constants of every reaction at every given temperature; one
+        row per reaction, one column per temperature.
+        """
+        temperatures = list(temperatures)
+        return [r.equilibrium_constants(temperatures) for r in self.reactions]
@@ -1,10 +1,27 @@
 from dataclasses import dataclass
-from math import exp
+from functools import cached_property
+from math import exp, log
+from operator import mul
+from typing import Iterable
 
-from crdlib.chemical_substances.substance import ChemicalReactionFactors
+from crdlib.chemical_reactions.exceptions import UndefinedThermalCapacityCoefficient
+from crdlib.chemical_substances.substance import (
+    ChemicalReactionFactors,
+    ChemicalSubstance,
+)
 from crdlib.equations.equation import Term
 from crdlib.properties.properties import Temperature
 from crdlib.properties.constants import GLOBAL_GAS_CONSTANT
+from crdlib.properties.thermophysical.thermal_capacity_coefficient import (
+    COEFFICIENTS_BY_SYMBOL,
+    ThermalCapacityCoefficient,
+)
+from crdlib.properties.units.converters import EnergyUnitConverter
+
+_STANDARD_FORMATION_PROPERTIES = ("gibbs_free_energy", "enthalpy")
+
+_R_SI: float = GLOBAL_GAS_CONSTANT.to_si().value
+_T_REF_K: float = 298.15
 
 
 @dataclass
@@ -13,10 +30,42 @@ class ChemicalReaction:
     products: ChemicalReactionFactors
     reaction_rate: Term
 
+    def __post_init__(self) -> None:
+        # the values below are derived from the factors, thus keep factors that
+        # cannot change afterwards
+        self.reactants = self.reactants.snapshot()
+        self.products = self.products.snapshot()
+        self._reactant_coefficients = self._stoichiometric_coefficients(self.reactants)
+        self._product_coefficients = self._stoichiometric_coefficients(self.products)
+        self._reactant_values = self._standard_property_values(self.reactants)
+        self._product_values = self._standard_property_values(self.products)
+        self._equilibrium_constants: dict[float, float] = dict()
+
     def equilibrium_constant(self, temperature: Temperature) -> float:
-        return self.calculate_equilibrium_constant(
-            temperature, self.reactants, self.products
-        )
+        """
+        Equilibrium constant of the reaction at the given temperature.
+
+        Results are cached per temperature (in SI units), since a reaction is
+        usually evaluated repeatedly over the same temperature points.
+        """
+        return self.equilibrium_constants([temperature])[0]
+
+    def equilibrium_constants(self, temperatures: Iterable[Temperature]) -> list[float]:
+        """
+        Equilibrium constants of the reaction at each of the given temperatures,
+        e.g. for a temperature sweep. Temperatures that are not cached yet are
+        calculated in a single batch.
+        """
+        temperatures_Kelvin = [t.si_value for t in temperatures]
+        missing = [
+            t for t in temperatures_Kelvin if t not in self._equilibrium_constants
+        ]
+        if missing:
+            constants = self._calculate_equilibrium_constants(
+                *self._equilibrium_constant_arguments, missing
+            )
+            self._equilibrium_constants.update(zip(missing, constants))
+        return [self._equilibrium_constants[t] for t in temperatures_Kelvin]
 
     @classmethod
     def calculate_equilibrium_constant(
@@ -25,59 +74,214 @@ class ChemicalReaction:
         reactants: ChemicalReactionFactors,
         products: ChemicalReactionFactors,
     ) -> float:
-        pass
+        return cls._calculate_equilibrium_constants(
+            *cls._thermal_capacity_coefficient_diffs(reactants, products),
+            *(
+                cls._standard_property_sum(
+                    cls._stoichiometric_coefficients(products),
+                    cls._standard_property_values(products)[property],
+                )
+                - cls._standard_property_sum(
+                    cls._stoichiometric_coefficients(reactants),
+                    cls._standard_property_values(reactants)[property],
+                )
+                for property in _STANDARD_FORMATION_PROPERTIES
+            ),
+            [temperature.si_value],
+        )[0]
 
     def standard_gibbs_free_energy_diff(self) -> float:
-        return self._standard_property_diff("gibbs_free_energy")
+        return self._standard_property_diffs["gibbs_free_energy"]
 
     def standard_enthalpy_diff(self) -> float:
-        return self._standard_property_diff("enthalpy")
+        return self._standard_property_diffs["enthalpy"]
+
+    @cached_property
+    def _standard_property_diffs(self) -> dict[str, float]:
+        return {
+            property: self._standard_property_diff(property)
+            for property in _STANDARD_FORMATION_PROPERTIES
+        }
 
     def _standard_property_diff(self, property: str) -> float:
-        return self.__class__._standard_property_diff(
-            self.reactants, self.products, property
+        return self._standard_property_sum(
+            self._product_coefficients, self._product_values[property]
+        ) - self._standard_property_sum(
+            self._reactant_coefficients, self._reactant_values[property]
+        )
+
+    @cached_property
+    def _equilibrium_constant_arguments(self) -> tuple[float, ...]:
+        return (
+            *self._thermal_capacity_coefficient_diffs(self.reactants, self.products),
+            self.standard_gibbs_free_energy_diff(),
+            self.standard_enthalpy_diff(),
         )
 
+    @staticmethod
+    def _stoichiometric_coefficients(
+        factors: ChemicalReactionFactors,
+    ) -> tuple[int, ...]:
+        return tuple(p.stoichiometric_coefficient for p in factors.participants)
+
+    @staticmethod
+    def _standard_property_values(
+        factors: ChemicalReactionFactors,
+    ) -> dict[str, tuple[float, ...]]:
+        """
+        Collect the SI values of the standard formation properties of the given
+        factors; one tuple per property, ordered like `factors.participants`.
+        """
+        return {
+            property: tuple(
+                getattr(p.substance.standard_formation_properties, property).si_value
+                for p in factors.participants
+            )
+            for property in _STANDARD_FORMATION_PROPERTIES
+        }
+
     @classmethod
-    def _standard_property_diff(
-        cls,
-        reactans: ChemicalReactionFactors,
-        products: ChemicalReactionFactors,
-        property: str,
-    ) -> float:
-        return cls._standard_property_sum(
-            reactans, property
-        ) - cls._standard_property_sum(products, property)
+    def _thermal_capacity_coefficient_diffs(
+        cls, reactants: ChemicalReactionFactors, products: ChemicalReactionFactors
+    ) -> tuple[float, float, float, float]:
+        """
+        Differences (products minus reactants) of the coefficients of the
+        dimensionless thermal capacity `Cp/R`.
+        """
+        gas_constant = _R_SI * EnergyUnitConverter.JOULE_TO_CALORIE
+        reactant_sums = cls._thermal_capacity_coefficient_sums(reactants)
+        product_sums = cls._thermal_capacity_coefficient_sums(products)
+        return (
+            (product_sums[0] - reactant_sums[0]) / gas_constant,
+            (product_sums[1] - reactant_sums[1]) / gas_constant,
+            (product_sums[2] - reactant_sums[2]) / gas_constant,
+            (product_sums[3] - reactant_sums[3]) / gas_constant,
+        )
+
+    @staticmethod
+    def _thermal_capacity_coefficient_sums(
+        factors: ChemicalReactionFactors,
+    ) -> tuple[float, float, float, float]:
+        coefficients = [
+            (
+                p.stoichiometric_coefficient,
+                _thermal_capacity_coefficient(p.substance),
+            )
+            for p in factors.participants
+        ]
+        return (
+            sum(n * c.A for n, c in coefficients),
+            sum(n * c.B for n, c in coefficients),
+            sum(n * c.C for n, c in coefficients),
+            sum(n * c.D for n, c in coefficients),
+        )
 
     @staticmethod
     def _standard_property_sum(
-        factors: ChemicalReactionFactors, property: str
+        coefficients: tuple[int, ...], values: tuple[float, ...]
     ) -> float:
-        prop = 0
-        for p in factors.participants:
-            prop += p.stoichiometric_coefficient * getattr(
-                p.substance.standard_formation_properties, property
-            )
-        return prop
+        return sum(map(mul, coefficients, values))
 
     @staticmethod
-    def _calculate_equilibrium_constant(
+    def _calculate_equilibrium_constants(
         delta_A: float,
         delta_B: float,
         delta_C: float,
         delta_D: float,
         standard_gibbs_free_energy_diff: float,
         standard_enthalpy_diff: float,
-        temperature_Kelvin: float,
-        standard_temperature_Kelvin: float = 298.15,
-    ):
-        gibbs_free_energy_factor = ...
-        enthalpy_factor = ...
-        enthalpy_change_factor = ...
-        entropy_change_factor = ...
-        return exp(
-            -gibbs_free_energy_factor
-            + enthalpy_factor
-            - enthalpy_change_factor
-            + entropy_change_factor
+        temperatures_Kelvin: Iterable[float],
+        standard_temperature_Kelvin: float = _T_REF_K,
+    ) -> list[float]:
+        """
+        Calculate the equilibrium constant at each of the given temperatures.
+
+        `delta_A` to `delta_D` are the differences of the coefficients of
+        ``
+        Cp/R = A + B*T + C*T^2 + D/(T^2)
+        ``
+        between products and reactants.
+        """
+        return _equilibrium_constants(
+            delta_A,
+            delta_B,
+            delta_C,
+            delta_D,
+            standard_gibbs_free_energy_diff,
+            standard_enthalpy_diff,
+            temperatures_Kelvin,
+            standard_temperature_Kelvin,
+        )
+
+
+def _thermal_capacity_coefficient(
+    substance: ChemicalSubstance,
+) -> ThermalCapacityCoefficient:
+    coefficient = (
+        None
+        if substance.symbol is None
+        else COEFFICIENTS_BY_SYMBOL.get(substance.symbol)
+    )
+    if coefficient is None:
+        raise UndefinedThermalCapacityCoefficient(
+            f"thermal capacity coefficients have not been defined for {substance!r}. "
+        )
+    return coefficient
+
+
+def _equilibrium_constants(
+    delta_A: float,
+    delta_B: float,
+    delta_C: float,
+    delta_D: float,
+    standard_gibbs_free_energy_diff: float,
+    standard_enthalpy_diff: float,
+    temperatures_Kelvin: Iterable[float],
+    standard_temperature_Kelvin: float,
+) -> list[float]:
+    """
+    Numeric kernel of `ChemicalReaction._calculate_equilibrium_constants`.
+
+    Factors that do not depend on the temperature are calculated once for the
+    whole batch; the loop body only uses local floats.
+    """
+    T0 = standard_temperature_Kelvin
+    RT0 = _R_SI * T0
+    gibbs_free_energy_factor = standard_gibbs_free_energy_diff / RT0
+    standard_enthalpy_factor = standard_enthalpy_diff / RT0
+
+    # integrals of Cp/R and Cp/(R*T), evaluated in Horner form
+    half_B = delta_B / 2
+    third_C = delta_C / 3
+    half_C = delta_C / 2
+    half_D = delta_D / 2
+    thermal_capacity_integral_T0 = (
+        T0 * (delta_A + T0 * (half_B + T0 * third_C)) - delta_D / T0
+    )
+    thermal_capacity_over_temperature_integral_T0 = (
+        delta_A * log(T0) + T0 * (delta_B + T0 * half_C) - half_D / (T0 * T0)
+    )
+
+    constants = []
+    for T in temperatures_Kelvin:
+        enthalpy_factor = standard_enthalpy_factor * (1 - T0 / T)
+        enthalpy_change_factor = (
+            T * (delta_A + T * (half_B + T * third_C))
+            - delta_D / T
+            - thermal_capacity_integral_T0
+        ) / T
+        entropy_change_factor = (
+            delta_A * log(T)
+            + T * (delta_B + T * half_C)
+            - half_D / (T * T)
+            - thermal_capacity_over_temperature_integral_T0
+        )
+        constants.append(
+            exp(
+                -gibbs_free_energy_factor
+                + enthalpy_factor
+                - enthalpy_change_factor
+                + entropy_change_factor
+            )
         )
+    return constants
@@ -1,14 +1,17 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 
-class ChemicalReactor(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ChemicalReactor:
     pass
 
 
+@dataclass(frozen=True, slots=True)
 class BedReactor(ChemicalReactor):
     length: float
     radius: float
 
 
+@dataclass(frozen=True, slots=True)
 class FixedBedReactor(BedReactor):
     pass
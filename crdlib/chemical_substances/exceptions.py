@@ -11,3 +11,7 @@ class InvalidChemicalCompoundComponentBinaryOperation(CRDLibException):
 
 class WrongChemicalReactionFactorType(CRDLibException):
     description = "got a wrong chemical reaction factor type. "
+
+
+class ChemicalSubstanceSymbolChange(CRDLibException):
+    description = "cannot change the symbol of a hashed chemical substance. "
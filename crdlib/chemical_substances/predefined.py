@@ -1,4 +1,5 @@
 from enum import Enum, EnumMeta
+from types import MappingProxyType
 
 from crdlib.properties.units.units import (
     TemperatureUnit,
@@ -34,6 +35,9 @@ def _create_atom(
 
 _atom_map: dict[str, Atom] = dict()
 
+# read-only view for callers that look up many atoms
+ATOMS_BY_SYMBOL = MappingProxyType(_atom_map)
+
 
 class AtomsMeta(EnumMeta):
     def __getitem__(self, name: str) -> Atom:  # type: ignore
@@ -52,7 +56,7 @@ class Atoms(Enum, metaclass=AtomsMeta):
 
     @staticmethod
     def get(name: str) -> Atom:
-        return Atoms.__getitem__(name)
+        return _atom_map[name]
 
     HYDROGEN = _create_atom(1, 1.0080, "H", ChemicalGroup.NON_METAL)
     HELIUM = _create_atom(2, 4.00260, "He", ChemicalGroup.NOBLE_GAS)
@@ -138,6 +142,8 @@ def _create_substance(
 
 _substance_map: dict[str, ChemicalSubstance] = dict()
 
+SUBSTANCES_BY_SYMBOL = MappingProxyType(_substance_map)
+
 
 class ChemicalSubstancesMeta(EnumMeta):
     def __getitem__(self, name: str) -> ChemicalSubstance:  # type: ignore
@@ -167,7 +173,7 @@ class ChemicalSubstances(Enum, metaclass=ChemicalSubstancesMeta):
 
     @staticmethod
     def get(name: str) -> ChemicalSubstance:
-        return ChemicalSubstances.__getitem__(name)
+        return _substance_map[name]
 
     HYDROGEN = _create_substance(
         ChemicalElement(Atoms.get("H"), 2),
@@ -202,7 +208,7 @@ class ChemicalSubstances(Enum, metaclass=ChemicalSubstancesMeta):
         Temperature(132.92, TemperatureUnit.KELVIN),
         Pressure(34.99, PressureUnit.BAR),
         MolarVolume(0.0944, (LengthUnit.METER**3) / AmountUnit.KILO_MOL),
-        FormationEnthalpy(-110.52, EnergyUnit.KILO_CALORIE / AmountUnit.MOL),
+        FormationEnthalpy(-110.52, EnergyUnit.KILO_JOULE / AmountUnit.MOL),
         FormationGibbsFreeEnergy(-137.27, EnergyUnit.KILO_JOULE / AmountUnit.MOL),
     )
     CARBON_DIOXIDE = _create_substance(
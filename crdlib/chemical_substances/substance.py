@@ -1,11 +1,24 @@
-from typing import Iterable, Optional, Union, List, Protocol
-from dataclasses import dataclass
-from abc import ABCMeta
-from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    Final,
+    Iterable,
+    Optional,
+    Union,
+    List,
+    Tuple,
+    Protocol,
+    TypeVar,
+)
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
+from collections import Counter
+from operator import attrgetter, index
 
 from crdlib.chemical_substances.exceptions import (
     InvalidChemicalReactionFactorBinaryOperation,
     InvalidChemicalCompoundComponentBinaryOperation,
+    ChemicalSubstanceSymbolChange,
 )
 from crdlib.properties.properties import (
     Temperature,
@@ -31,20 +44,22 @@ class ChemicalReactionFactor(Protocol):
         ...
 
 
-class ChemicalGroup(str, Enum):
-    NON_METAL = "NON_METAL"
-    NOBLE_GAS = "NOBLE_GAS"
-    ALKALI_METAL = "ALKALI_METAL"
-    ALKALINE_EARTH_METAL = "ALKALINE_EARTH_METAL"
-    METALLOID = "METALLOID"
-    HALOGEN = "HALOGEN"
-    POST_TRANSITION_METAL = "POST_TRANSITION_METAL"
-    TRANSITION_METAL = "TRANSITION_METAL"
-    LANTHANIDE = "LANTHANIDE"
-    ACTINIDE = "ACTINIDE"
+class ChemicalGroup(IntEnum):
+    __str__ = Enum.__str__
+
+    NON_METAL = 0
+    NOBLE_GAS = 1
+    ALKALI_METAL = 2
+    ALKALINE_EARTH_METAL = 3
+    METALLOID = 4
+    HALOGEN = 5
+    POST_TRANSITION_METAL = 6
+    TRANSITION_METAL = 7
+    LANTHANIDE = 8
+    ACTINIDE = 9
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 @implements(ChemicalCompoundComponent)
 class Atom:
     atomic_number: int
@@ -53,84 +68,129 @@ class Atom:
     chemical_group: ChemicalGroup
 
     def __mul__(self, coeff: int) -> "ChemicalElement":
-        if not isinstance(coeff, int) or coeff <= 0:
+        number_of_atoms = _positive_int(coeff)
+        if number_of_atoms is None:
             raise InvalidChemicalCompoundComponentBinaryOperation(
                 f"cannot multiply {self} with {coeff}; `number_of_atoms` must"
                 " be a positive int. "
             )
-        return ChemicalElement(self, coeff)
+        # a new element, since the caller may set properties on it
+        return ChemicalElement(self, number_of_atoms)
 
     def __lshift__(self, other: ChemicalCompoundComponent) -> "ChemicalCompound":
-        if isinstance(other, (Atom, ChemicalElement)):
-            return ChemicalCompound([self, other])
-        elif isinstance(other, ChemicalCompound):
-            elements = other.elements
-            elements.append(ChemicalElement(self))
-            return ChemicalCompound(elements)
-        else:
-            raise InvalidChemicalCompoundComponentBinaryOperation(
-                f"cannot add {other} to {self}. "
-            )
+        return _merge_components(self, other)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ChemicalReactionFactors:
-    participants: List["ChemicalReactionParticipant"]
+    """
+    The participants of one side of a chemical reaction. Adding a factor appends
+    it in place, unless the factors are a snapshot (see `snapshot`).
+    """
+
+    participants: Union[
+        List["ChemicalReactionParticipant"], Tuple["ChemicalReactionParticipant", ...]
+    ]
 
     def __init__(self, factors: Iterable[ChemicalReactionFactor]) -> None:
-        _factors = []
-        for f in factors:
-            if isinstance(f, (ChemicalCompound, ChemicalElement)):
-                _factors.append(ChemicalReactionParticipant(f))
-            elif isinstance(f, ChemicalReactionParticipant):
-                _factors.append(f)
-            else:
-                raise TypeError(f"cannot create ChemicalReactionFactors with {f}. ")
-        self.participants = _factors
+        self.participants = list(map(_to_participant, factors))
+
+    def snapshot(self) -> "ChemicalReactionFactors":
+        """
+        Copy of these factors with the participants stored in a tuple, e.g. for a
+        reaction that keeps values derived from its factors; adding to a snapshot
+        creates new factors.
+        """
+        factors = ChemicalReactionFactors.__new__(ChemicalReactionFactors)
+        factors.participants = tuple(self.participants)
+        return factors
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ChemicalReactionFactors):
+            return NotImplemented
+        return tuple(self.participants) == tuple(other.participants)
 
     def __mul__(self, coeff: int) -> "ChemicalReactionFactors":
-        if not isinstance(coeff, int) or coeff <= 0:
+        _coeff = _positive_int(coeff)
+        if _coeff is None:
             raise InvalidChemicalReactionFactorBinaryOperation(
                 f"cannot multiply chemical reaction factors with {coeff}; `coeff` must"
                 " be an int. "
             )
-        for f in self.participants:
-            f *= coeff
-        return self
+        return ChemicalReactionFactors([p * _coeff for p in self.participants])
 
     def __add__(self, other: ChemicalReactionFactor) -> "ChemicalReactionFactors":
-        if isinstance(other, ChemicalReactionParticipant):
-            self.participants.append(other)
-        elif isinstance(other, (ChemicalCompound, ChemicalElement)):
-            self.participants.append(ChemicalReactionParticipant(other))
-        else:
+        to_participant = _dispatch(_participant_factories, other)
+        if to_participant is None:
             raise InvalidChemicalReactionFactorBinaryOperation(
                 f"cannot add {other} to chemical reaction factors. "
             )
+        participant = to_participant(other)
+        if isinstance(self.participants, tuple):
+            return ChemicalReactionFactors([*self.participants, participant])
+        self.participants.append(participant)
         return self
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, eq=False)
 class CriticalProperties:
     temperature: Temperature
     pressure: Pressure
     volume: MolarVolume
 
 
-@dataclass
+# shared by all standard formation properties, thus it cannot be converted in place
+_STANDARD_TEMPERATURE: Final = Temperature(25, TemperatureUnit.CELCIUS).share()
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class StandardFormationProperties:
     enthalpy: FormationEnthalpy
     gibbs_free_energy: FormationGibbsFreeEnergy
-    temperature: Temperature = Temperature(25, TemperatureUnit.CELCIUS)
+    temperature: Temperature = field(default_factory=lambda: _STANDARD_TEMPERATURE)
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 @implements(ChemicalReactionFactor)
-class ChemicalSubstance(metaclass=ABCMeta):
+class ChemicalSubstance:
+    """
+    Substances are equal when they are of the same type and have the same symbol
+    and molecular weight; substances without a symbol must have the same
+    composition too. The hash of a substance depends only on its type and symbol;
+    it is calculated once, on first use, thus the symbol cannot be changed
+    afterwards.
+    """
+
     molecular_weight: float
     symbol: Optional[str]
     critical_properties: Optional[CriticalProperties]
     standard_formation_properties: Optional[StandardFormationProperties]
+    _hash: int = field(init=False, repr=False)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self is other or (
+            self.symbol == other.symbol  # type: ignore
+            and self.molecular_weight == other.molecular_weight  # type: ignore
+            and (
+                self.symbol is not None
+                or self._composition() == other._composition()  # type: ignore
+            )
+        )
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((self.__class__, self.symbol))
+            return self._hash
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(symbol={self.symbol!r}, "
+            f"molecular_weight={self.molecular_weight})"
+        )
 
     def set_critical_properties(self, critical_properties: CriticalProperties) -> None:
         self.critical_properties = critical_properties
@@ -141,27 +201,47 @@ class ChemicalSubstance(metaclass=ABCMeta):
         self.standard_formation_properties = standard_formation_properties
 
     def set_symbol(self, symbol: str) -> None:
-        self.symbol = symbol
+        """
+        Set the symbol of this substance. Raises `ChemicalSubstanceSymbolChange`
+        once the substance has been hashed, e.g. used as a dict key, since its hash
+        depends on the symbol.
+        """
+        try:
+            self._hash
+        except AttributeError:
+            self.symbol = symbol
+            return
+        raise ChemicalSubstanceSymbolChange(
+            f"cannot set the symbol of {self!r} to {symbol!r}; it has been hashed. "
+        )
+
+    def _composition(self) -> Any:
+        """
+        What tells apart substances without a symbol that have the same molecular
+        weight.
+        """
+        return None
 
     def __mul__(self, coeff: int) -> "ChemicalReactionParticipant":
-        if not isinstance(coeff, int) or coeff <= 0:
+        _coeff = _positive_int(coeff)
+        if _coeff is None:
             raise InvalidChemicalReactionFactorBinaryOperation(
                 f"cannot multiply {self} with {coeff}; `coeff` must be an int. "
             )
-        return ChemicalReactionParticipant(self, coeff)
+        return ChemicalReactionParticipant(self, _coeff)
 
     def __add__(self, other: ChemicalReactionFactor) -> ChemicalReactionFactors:
-        if isinstance(other, (Atom, ChemicalElement, ChemicalCompound)):
-            return ChemicalReactionFactors(
-                [ChemicalReactionParticipant(self, 1), other]
+        if _dispatch(_participant_factories, other) is None:
+            raise InvalidChemicalReactionFactorBinaryOperation(
+                f"cannot add {other} to {self}. "
             )
-        raise InvalidChemicalReactionFactorBinaryOperation(
-            f"cannot add {other} to {self}. "
-        )
+        return ChemicalReactionFactors([ChemicalReactionParticipant(self, 1), other])
 
 
 @implements(ChemicalCompoundComponent)
 class ChemicalElement(ChemicalSubstance):
+    __slots__ = ("atom", "number_of_atoms")
+
     atom: Atom
     number_of_atoms: int
 
@@ -177,23 +257,34 @@ class ChemicalElement(ChemicalSubstance):
         self.critical_properties = critical_properties
         self.standard_formation_properties = standard_formation_properties
         self.molecular_weight = self.atom.atomic_mass * number_of_atoms
-        self.symbol = atom.symbol + str(number_of_atoms)
+        self.symbol = f"{atom.symbol}{number_of_atoms}"
+
+    @classmethod
+    def get(cls, atom: Atom, number_of_atoms: int = 1) -> "ChemicalElement":
+        """
+        Get the shared element made of `number_of_atoms` atoms of `atom`.
+
+        Elements are interned per atom symbol and number of atoms; use this for
+        elements that only describe the composition of a compound. Elements that
+        get critical or formation properties set should be created directly.
+        """
+        key = (atom.symbol, number_of_atoms)
+        element = _element_map.get(key)
+        if element is None:
+            element = _element_map.setdefault(key, cls(atom, number_of_atoms))
+        return element
 
     def __lshift__(self, other: "ChemicalCompoundComponent") -> "ChemicalCompound":
-        if isinstance(other, (Atom, ChemicalElement)):
-            return ChemicalCompound([self, other])
-        elif isinstance(other, ChemicalCompound):
-            elements = other.elements
-            elements.append(self)
-            return ChemicalCompound(elements)
-        else:
-            raise InvalidChemicalCompoundComponentBinaryOperation(
-                f"cannot add {other} to {self}. "
-            )
+        return _merge_components(self, other)
+
+
+_element_map: dict[tuple[str, int], ChemicalElement] = dict()
 
 
 @implements(ChemicalCompoundComponent)
 class ChemicalCompound(ChemicalSubstance):
+    __slots__ = ("elements",)
+
     elements: list[ChemicalElement]
 
     def __init__(
@@ -203,44 +294,208 @@ class ChemicalCompound(ChemicalSubstance):
         critical_properties: Optional[CriticalProperties] = None,
         standard_formation_properties: Optional[StandardFormationProperties] = None,
     ) -> None:
-        _elements: List[ChemicalElement] = []
-        for element in elements:
-            if isinstance(element, Atom):
-                _elements.append(ChemicalElement(element))
-            else:
-                _elements.append(element)
-        self.elements = _elements
+        self._initialize(
+            [ChemicalElement.get(e) if isinstance(e, Atom) else e for e in elements],
+            symbol,
+            critical_properties,
+            standard_formation_properties,
+        )
+
+    @classmethod
+    def from_elements(
+        cls, elements: Iterable[ChemicalElement], symbol: Optional[str] = None
+    ) -> "ChemicalCompound":
+        """
+        Create a compound from elements only, skipping the per component type
+        check of `__init__`.
+        """
+        compound = cls.__new__(cls)
+        compound._initialize(list(elements), symbol, None, None)
+        return compound
+
+    @classmethod
+    def bulk_from_elements(
+        cls, element_lists: Iterable[Iterable[ChemicalElement]]
+    ) -> list["ChemicalCompound"]:
+        """
+        Create one compound per given list of elements, e.g. when creating many
+        compounds parsed from some source.
+        """
+        return [cls.from_elements(elements) for elements in element_lists]
+
+    @classmethod
+    def from_atoms(
+        cls,
+        atoms: Iterable[Atom],
+        counts: Iterable[int],
+        symbol: Optional[str] = None,
+    ) -> "ChemicalCompound":
+        """
+        Create a compound from atoms and the number of atoms of each one, e.g.
+        ``
+        water = ChemicalCompound.from_atoms([Atoms["H"], Atoms["O"]], [2, 1])
+        ``
+        """
+        return cls.from_elements(map(ChemicalElement.get, atoms, counts), symbol)
+
+    @classmethod
+    def _concatenate(
+        cls, elements: list[ChemicalElement], molecular_weight: float
+    ) -> "ChemicalCompound":
+        """
+        Create a compound from the merged elements of two components, reusing
+        their already known total molecular weight.
+        """
+        compound = cls.__new__(cls)
+        compound._initialize(elements, None, None, None, molecular_weight)
+        return compound
+
+    def _initialize(
+        self,
+        elements: list[ChemicalElement],
+        symbol: Optional[str],
+        critical_properties: Optional[CriticalProperties],
+        standard_formation_properties: Optional[StandardFormationProperties],
+        molecular_weight: Optional[float] = None,
+    ) -> None:
+        self.elements = elements
         self.symbol = symbol
         self.critical_properties = critical_properties
         self.standard_formation_properties = standard_formation_properties
-        self.molecular_weight = sum([e.molecular_weight for e in self.elements])
+        if molecular_weight is None:
+            molecular_weight = sum(map(_molecular_weight, elements))
+        self.molecular_weight = molecular_weight
 
     def __lshift__(self, other: "ChemicalCompoundComponent") -> "ChemicalCompound":
-        elements = self.elements
-        if isinstance(other, Atom):
-            elements.append(ChemicalElement(other))
-            return ChemicalCompound(elements)
-        elif isinstance(other, ChemicalElement):
-            elements.append(other)
-            return ChemicalCompound(elements)
-        elif isinstance(other, ChemicalCompound):
-            elements.extend(other.elements)
-            return ChemicalCompound(elements)
-        else:
+        return _merge_components(self, other)
+
+    def _composition(self) -> frozenset[tuple[str, int]]:
+        """
+        The number of atoms of each atom symbol in this compound, regardless of
+        the order of its elements.
+        """
+        atoms: Counter[str] = Counter()
+        for element in self.elements:
+            atoms[element.atom.symbol] += element.number_of_atoms
+        return frozenset(atoms.items())
+
+
+class ChemicalCompoundBuilder:
+    """
+    Collects the components of a compound and creates the `ChemicalCompound` only
+    once, instead of creating a new compound on every `<<`:
+    ``
+    builder = ChemicalCompoundBuilder()
+    for atom in atoms:
+        builder << atom
+    compound = builder.build()
+    ``
+    """
+
+    __slots__ = ("_elements",)
+
+    def __init__(self) -> None:
+        self._elements: list[ChemicalElement] = []
+
+    def __lshift__(self, other: ChemicalCompoundComponent) -> "ChemicalCompoundBuilder":
+        component_parts = _dispatch(_component_parts, other)
+        if component_parts is None:
             raise InvalidChemicalCompoundComponentBinaryOperation(
                 f"cannot add {other} to {self}. "
             )
+        self._elements.extend(component_parts(other)[0])
+        return self
 
+    def build(self, symbol: Optional[str] = None) -> ChemicalCompound:
+        return ChemicalCompound.from_elements(self._elements, symbol)
 
-@dataclass
+
+@dataclass(slots=True)
 @implements(ChemicalReactionFactor)
 class ChemicalReactionParticipant:
     substance: ChemicalSubstance
     stoichiometric_coefficient: int = 1
 
     def __mul__(self, coeff: int) -> "ChemicalReactionParticipant":
-        self.stoichiometric_coefficient *= coeff
-        return self
+        _coeff = _positive_int(coeff)
+        if _coeff is None:
+            raise InvalidChemicalReactionFactorBinaryOperation(
+                f"cannot multiply {self} with {coeff}; `coeff` must be an int. "
+            )
+        return ChemicalReactionParticipant(
+            self.substance, self.stoichiometric_coefficient * _coeff
+        )
 
     def __add__(self, other: ChemicalReactionFactor) -> ChemicalReactionFactors:
         return ChemicalReactionFactors([self, other])
+
+
+_molecular_weight = attrgetter("molecular_weight")
+
+
+def _positive_int(value: Any) -> Optional[int]:
+    """
+    Get `value` as an int if it is a positive integer (of any type implementing
+    `__index__`), else None.
+    """
+    try:
+        value = index(value)
+    except TypeError:
+        return None
+    return value if value > 0 else None
+
+
+def _to_participant(factor: ChemicalReactionFactor) -> ChemicalReactionParticipant:
+    to_participant = _dispatch(_participant_factories, factor)
+    if to_participant is None:
+        raise TypeError(f"cannot create ChemicalReactionFactors with {factor}. ")
+    return to_participant(factor)
+
+
+_T = TypeVar("_T")
+
+
+def _dispatch(table: dict[type, _T], obj: Any) -> Optional[_T]:
+    """
+    Get the entry of `table` for the type of `obj`, falling back to the entries of
+    its base classes; entries found for a subclass are added to `table`.
+    """
+    cls = type(obj)
+    if cls in table:
+        return table[cls]
+    for base in cls.__mro__[1:]:
+        if base in table:
+            table[cls] = table[base]
+            return table[cls]
+    return None
+
+
+def _merge_components(
+    component: ChemicalCompoundComponent, other: ChemicalCompoundComponent
+) -> ChemicalCompound:
+    component_parts = _dispatch(_component_parts, component)
+    other_parts = _dispatch(_component_parts, other)
+    if component_parts is None or other_parts is None:
+        raise InvalidChemicalCompoundComponentBinaryOperation(
+            f"cannot add {other} to {component}. "
+        )
+    elements, molecular_weight = component_parts(component)
+    other_elements, other_molecular_weight = other_parts(other)
+    return ChemicalCompound._concatenate(
+        [*elements, *other_elements], molecular_weight + other_molecular_weight
+    )
+
+
+# elements and molecular weight of each type of compound component
+_component_parts: dict[type, Callable[[Any], tuple[list[ChemicalElement], float]]] = {
+    Atom: lambda a: ([ChemicalElement.get(a)], a.atomic_mass),
+    ChemicalElement: lambda e: ([e], e.molecular_weight),
+    ChemicalCompound: lambda c: (c.elements, c.molecular_weight),
+}
+
+# conversion of each type of chemical reaction factor to a participant
+_participant_factories: dict[type, Callable[[Any], ChemicalReactionParticipant]] = {
+    ChemicalElement: ChemicalReactionParticipant,
+    ChemicalCompound: ChemicalReactionParticipant,
+    ChemicalReactionParticipant: lambda p: p,
+}
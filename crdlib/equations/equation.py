@@ -1,8 +1,7 @@
 from __future__ import annotations
 from enum import Enum
-from typing import Iterable
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class BinaryOperation(Enum):
@@ -13,8 +12,10 @@ class BinaryOperation(Enum):
 
 
 class Equation(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
     lhs: Term
-    rhs: Iterable[Term]
+    rhs: tuple[Term, ...]
 
 
 class Term:
@@ -51,3 +52,6 @@ class DependentVariable(Factor):
 
 class Constant(Factor):
     pass
+
+
+Equation.model_rebuild()
@@ -1,26 +1,33 @@
-from enum import Enum
-from typing import Iterable
+from enum import Enum, IntEnum
 
 from crdlib.chemical_substances.substance import ChemicalSubstance
 from crdlib.phases.phase import Phase
 
 
-class BalanceTerm(Enum):
-    ACCUMULATION = "ACCUMULATION"
+class BalanceTerm(IntEnum):
+    """
+    Base of the terms of a balance equation; every type of balance has an
+    `ACCUMULATION` term. Values are unique across all balance terms, since int
+    enums of different types compare equal when their values do.
+    """
+
+    __str__ = Enum.__str__
 
 
 class MolecularBalanceTerm(BalanceTerm):
-    REACTION_RATE = "REACTION_RATE"
-    CONVECTION = "CONVECTION"
-    DIFFUSION = "DIFFUSION"
-    SURFACE_TRANSFER = "SURFACE_TRANSFER"
+    ACCUMULATION = 0
+    REACTION_RATE = 1
+    CONVECTION = 2
+    DIFFUSION = 3
+    SURFACE_TRANSFER = 4
 
 
 class EnergyBalanceTerm(BalanceTerm):
-    REACTION_ENERGY = "REACTION_ENERGY"
-    CONVECTION = "CONVECTION"
-    CONDUCTION = "CONDUCTION"
-    SURFACE_TRANSFER = "SURFACE_TRANSFER"
+    ACCUMULATION = 5
+    REACTION_ENERGY = 6
+    CONVECTION = 7
+    CONDUCTION = 8
+    SURFACE_TRANSFER = 9
 
 
 class Balance:
@@ -33,9 +40,9 @@ class Balance:
 
 class MolecularBalance(Balance):
     species: ChemicalSubstance
-    terms: Iterable[MolecularBalanceTerm]
+    terms: tuple[MolecularBalanceTerm, ...]
 
 
 class EnergyBalance(Balance):
     phase: Phase
-    terms: Iterable[EnergyBalanceTerm]
+    terms: tuple[EnergyBalanceTerm, ...]
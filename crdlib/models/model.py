@@ -1,6 +1,6 @@
 from typing import Iterable
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from crdlib.chemical_reactors.reactor import ChemicalReactor
 from crdlib.chemical_reactions.reaction import ChemicalReaction
@@ -10,10 +10,12 @@ from crdlib.streams.stream import Stream
 
 
 class ReactorModel(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
     reactor: ChemicalReactor
-    reactions: Iterable[ChemicalReaction]
+    reactions: tuple[ChemicalReaction, ...]
     feed: Stream
-    regimes: Iterable[Regime]
+    regimes: tuple[Regime, ...]
 
     @property
     def molecular_balances(self) -> Iterable[MolecularBalance]:
@@ -1,20 +1,26 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 
-class Regime(Enum):
-    pass
+class Regime(IntEnum):
+    """
+    Base of the regimes of a reactor model. Values are unique across all regimes,
+    since regimes of different types are kept together (see `ReactorModel`) and
+    int enums of different types compare equal when their values do.
+    """
+
+    __str__ = Enum.__str__
 
 
 class TemporalRegime(Regime):
-    STEADY_STATE = "STEADY_STATE"
-    DYNAMIC = "DYNAMIC"
+    STEADY_STATE = 0
+    DYNAMIC = 1
 
 
 class FluidPhaseRegime(Regime):
-    HETEROGENEOUS = "HETEROGENEOUS"
-    PSEUDO_HOMOGENEOUS = "PSEUDO_HOMOGENEOUS"
+    HETEROGENEOUS = 2
+    PSEUDO_HOMOGENEOUS = 3
 
 
 class ThermalRegime(Regime):
-    ISOTHERMAL = "ISOTHERMAL"
-    NON_ISOTHERMAL = "NON_ISOTHERMAL"
+    ISOTHERMAL = 4
+    NON_ISOTHERMAL = 5
@@ -18,3 +18,7 @@ class InvalidUnitConversion(CRDLibException):
 
 class UndefinedConverter(CRDLibException):
     description = "a converter has not been defined for a given generic descriptor. "
+
+
+class SharedPhysicalPropertyConversion(CRDLibException):
+    description = "cannot convert a shared physical property in place. "
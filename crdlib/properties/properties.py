@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Type, ClassVar, TypeAlias
+from typing import Any, Iterable, Optional, Type, ClassVar, TypeAlias
 from typing_extensions import Self
 from abc import ABCMeta, abstractmethod
 
@@ -25,17 +25,48 @@ from crdlib.properties.units.converters import (
     get_converter,
     PhysicalPropertyUnitConverter,
 )
-from crdlib.properties.exceptions import WrongUnitDescriptorType
+from crdlib.properties.exceptions import (
+    UndefinedConverter,
+    WrongUnitDescriptorType,
+    SharedPhysicalPropertyConversion,
+)
 
 
-class AbstractPhysicalProperty(metaclass=ABCMeta):
+class PhysicalPropertyMeta(ABCMeta):
+    """
+    Gives every physical property class empty `__slots__` unless it declares its
+    own, so that property objects carry no instance `__dict__`.
+    """
+
+    def __new__(mcs, name: str, bases: tuple[type, ...], namespace: dict[str, Any]):
+        namespace.setdefault("__slots__", ())
+        return super().__new__(mcs, name, bases, namespace)
+
+
+class AbstractPhysicalProperty(metaclass=PhysicalPropertyMeta):
     """
     Base class for different types of physical properties.
     """
 
+    __slots__ = ("value", "unit_descriptor", "_si_value", "_shared")
+
     value: float
     unit_descriptor: UnitDescriptor
     generic_descriptor: ClassVar[GenericUnitDescriptor]
+    # type of the unit descriptors of the subclass, e.g. `MeasurementUnit`
+    _descriptor_type: ClassVar[Type[Any]]
+    _converter: ClassVar[Optional[Type[PhysicalPropertyUnitConverter]]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Resolve the converter of the subclass once, since `generic_descriptor` is a
+        class constant.
+        """
+        super().__init_subclass__(**kwargs)
+        try:
+            cls._converter = get_converter(cls.generic_descriptor)
+        except (AttributeError, UndefinedConverter):
+            cls._converter = None
 
     @abstractmethod
     def __init__(self, value: float, unit: UnitDescriptor) -> None:
@@ -45,12 +76,68 @@ class AbstractPhysicalProperty(metaclass=ABCMeta):
     def to_si(self) -> Self:
         """Create a new PhysicalProperty object with SI units."""
 
+    @property
+    def si_value(self) -> float:
+        """
+        The value of this property in SI units.
+
+        Computed on first access and cached together with the value and the unit
+        it was computed from, thus avoiding a `to_si()` conversion every time the
+        SI value of an unchanged property is needed; assigning `value` or
+        `unit_descriptor` makes the cache miss.
+        """
+        try:
+            value, unit, si_value = self._si_value
+        except AttributeError:
+            pass
+        else:
+            if value is self.value and unit is self.unit_descriptor:
+                return si_value
+        si_value = self.to_si().value
+        self._si_value: tuple[float, UnitDescriptor, float] = (
+            self.value,
+            self.unit_descriptor,
+            si_value,
+        )
+        return si_value
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.value} {self.unit_descriptor}>"
+
     def to_unit(self, unit: UnitDescriptor) -> Self:
         """
         Create a new PhysicalProperty object with specified unit.
         """
         return self.from_physical_property(self, unit)
 
+    def to_unit_(self, unit: UnitDescriptor) -> Self:
+        """
+        Convert this PhysicalProperty object to specified unit in place.
+
+        Avoids creating a new object, e.g. when normalising units inside iterative
+        calculations; only use when no other code relies on the previous unit of
+        this object, i.e. it is only safe on objects that are not aliased. Raises
+        `SharedPhysicalPropertyConversion` for shared properties, see `share`.
+        """
+        # the flag is only set by `share`, so that constructors do not pay for it
+        if getattr(self, "_shared", False):
+            raise SharedPhysicalPropertyConversion(
+                f"cannot convert {self} to {unit} in place; it is shared, use"
+                " `to_unit` instead. "
+            )
+        value = self._get_converter().convert(self.value, self.unit_descriptor, unit)
+        self.unit_descriptor = self._descriptor_type.from_descriptor(unit)
+        self.value = value
+        return self
+
+    def share(self) -> Self:
+        """
+        Mark this PhysicalProperty object as shared by several owners, e.g. a
+        default value; shared objects cannot be converted in place.
+        """
+        self._shared: bool = True
+        return self
+
     @classmethod
     def from_physical_property(
         cls, physical_property: "AbstractPhysicalProperty", to_unit: UnitDescriptor
@@ -58,6 +145,11 @@ class AbstractPhysicalProperty(metaclass=ABCMeta):
         """
         Create a new PhysicalProperty object with specified unit from given object.
         """
+        if (
+            isinstance(physical_property, cls)
+            and physical_property.unit_descriptor == to_unit
+        ):
+            return cls(value=physical_property.value, unit=to_unit)
         return cls(
             value=cls._get_converter().convert(
                 physical_property.value,
@@ -67,12 +159,63 @@ class AbstractPhysicalProperty(metaclass=ABCMeta):
             unit=to_unit,
         )
 
+    @classmethod
+    def convert_values(
+        cls,
+        values: Iterable[float],
+        from_unit: UnitDescriptor,
+        to_unit: UnitDescriptor,
+    ) -> list[float]:
+        """
+        Convert given values of this property from one unit to another.
+
+        Unit conversions are affine, thus the scale and offset of the conversion are
+        calculated once and applied to every value, instead of dispatching a
+        converter call per value.
+        """
+        converter = cls._get_converter()
+        offset = converter.convert(0.0, from_unit, to_unit)
+        scale = converter.convert(1.0, from_unit, to_unit) - offset
+        return [value * scale + offset for value in values]
+
     @classmethod
     def _get_converter(cls) -> Type[PhysicalPropertyUnitConverter]:
-        return get_converter(cls.generic_descriptor)
+        if cls._converter is None:
+            raise UndefinedConverter(
+                f"a converter has not been defined for {cls.__name__}. "
+            )
+        return cls._converter
+
+
+# Factors from the unit of an aliased property to its alias reference unit, keyed
+# by property class and unit string; strings, since descriptors are mutable.
+_base_units_factors: dict[tuple[type, str], float] = dict()
+
+
+def _to_base_units(
+    physical_property: "AliasedPhysicalProperty | AliasedCompositePhysicalProperty",
+) -> "CompositePhysicalProperty":
+    """
+    Convert given aliased property to its composite base units. Aliased units are
+    absolute, thus the conversion factor is computed once per class and unit.
+    """
+    cls = type(physical_property)
+    unit = physical_property.unit_descriptor
+    key = (cls, str(unit))
+    try:
+        factor = _base_units_factors[key]
+    except KeyError:
+        factor = cls._get_converter().convert(
+            1.0, unit, cls.reference_unit_mapping["alias"]
+        )
+        _base_units_factors[key] = factor
+    return CompositePhysicalProperty(
+        value=physical_property.value * factor,
+        unit=cls.reference_unit_mapping["composite"],
+    )
 
 
-@dataclass
+@dataclass(eq=False, repr=False)
 class PhysicalProperty(AbstractPhysicalProperty):
     """
     A physical property with a generic unit descriptor of type `MeasurementUnit`.
@@ -84,8 +227,13 @@ class PhysicalProperty(AbstractPhysicalProperty):
     EnergyUnit / MassUnit, which is a `CompositeDimension`.
     """
 
+    _descriptor_type = MeasurementUnit
+
     def __init__(self, value: float, unit: UnitDescriptor) -> None:
         self.value = value
+        if isinstance(unit, MeasurementUnit):
+            self.unit_descriptor = unit
+            return
         try:
             self.unit_descriptor = MeasurementUnit.from_descriptor(unit)
         except WrongUnitDescriptorType:
@@ -97,7 +245,7 @@ class PhysicalProperty(AbstractPhysicalProperty):
         return self.to_unit(SI_UNITS[self.generic_descriptor])
 
 
-@dataclass
+@dataclass(eq=False, repr=False)
 class ExponentPhysicalProperty(AbstractPhysicalProperty):
     """
     A physical property with a generic unit descriptor of type `Dimension`.
@@ -106,8 +254,13 @@ class ExponentPhysicalProperty(AbstractPhysicalProperty):
     power. e.g. Volume is produced by raising Length to the 3rd power.
     """
 
+    _descriptor_type = Dimension
+
     def __init__(self, value: float, unit: UnitDescriptor) -> None:
         self.value = value
+        if isinstance(unit, Dimension):
+            self.unit_descriptor = unit
+            return
         try:
             self.unit_descriptor = Dimension.from_descriptor(unit)
         except WrongUnitDescriptorType:
@@ -122,15 +275,20 @@ class ExponentPhysicalProperty(AbstractPhysicalProperty):
         )
 
 
-@dataclass
+@dataclass(eq=False, repr=False)
 class AliasedPhysicalProperty(AbstractPhysicalProperty):
     """A physical property with an aliased generic unit descriptor."""
 
     base_units_generic_descriptor: ClassVar[GenericUnitDescriptor]
     reference_unit_mapping: ClassVar[dict[str, UnitDescriptor]]
 
+    _descriptor_type = AliasedMeasurementUnit
+
     def __init__(self, value: float, unit: UnitDescriptor) -> None:
         self.value = value
+        if isinstance(unit, AliasedMeasurementUnit):
+            self.unit_descriptor = unit
+            return
         try:
             self.unit_descriptor = AliasedMeasurementUnit.from_descriptor(unit)
         except WrongUnitDescriptorType:
@@ -143,23 +301,25 @@ class AliasedPhysicalProperty(AbstractPhysicalProperty):
         Create a new `CompositePhyicalProperty` from this aliased property by converting
         to composite base units.
         """
-        return CompositePhysicalProperty(
-            value=self.to_unit(self.reference_unit_mapping["alias"]).value,
-            unit=self.reference_unit_mapping["composite"],
-        )
+        return _to_base_units(self)
 
     def to_si(self) -> "CompositePhysicalProperty":
         return self.to_base_units()
 
 
-@dataclass
+@dataclass(eq=False, repr=False)
 class CompositePhysicalProperty(AbstractPhysicalProperty):
     """
     A physical property with a generic unit descriptor of type `CompositeDimension`
     """
 
+    _descriptor_type = CompositeDimension
+
     def __init__(self, value: float, unit: UnitDescriptor) -> None:
         self.value = value
+        if isinstance(unit, CompositeDimension):
+            self.unit_descriptor = unit
+            return
         try:
             self.unit_descriptor = CompositeDimension.from_descriptor(unit)
         except WrongUnitDescriptorType:
@@ -168,17 +328,19 @@ class CompositePhysicalProperty(AbstractPhysicalProperty):
             )
 
     def to_si(self) -> "CompositePhysicalProperty":
-        numerator = list(map(self._to_si_dimension, self.unit_descriptor.numerator))
-        denominator = list(map(self._to_si_dimension, self.unit_descriptor.denominator))
+        numerator = tuple(map(self._to_si_dimension, self.unit_descriptor.numerator))
+        denominator = tuple(
+            map(self._to_si_dimension, self.unit_descriptor.denominator)
+        )
         unit = CompositeDimension(numerator, denominator)
         return self.to_unit(unit)
 
     @staticmethod
     def _to_si_dimension(dimension: Dimension) -> Dimension:
-        return Dimension(SI_UNITS[type(dimension.unit)])
+        return Dimension(SI_UNITS[type(dimension.unit)]) ** dimension.power
 
 
-@dataclass
+@dataclass(eq=False, repr=False)
 class AliasedCompositePhysicalProperty(AbstractPhysicalProperty):
     """
     A physical property with a generic unit descriptor of type `CompositeDimension`
@@ -188,8 +350,13 @@ class AliasedCompositePhysicalProperty(AbstractPhysicalProperty):
     base_units_generic_descriptor: ClassVar[GenericUnitDescriptor]
     reference_unit_mapping: ClassVar[dict[str, UnitDescriptor]]
 
+    _descriptor_type = CompositeDimension
+
     def __init__(self, value: float, unit: UnitDescriptor) -> None:
         self.value = value
+        if isinstance(unit, CompositeDimension):
+            self.unit_descriptor = unit
+            return
         try:
             self.unit_descriptor = CompositeDimension.from_descriptor(unit)
         except WrongUnitDescriptorType:
@@ -202,10 +369,7 @@ class AliasedCompositePhysicalProperty(AbstractPhysicalProperty):
         Create a new `CompositePhysicalProperty` from this aliased property by
         converting to composite base units.
         """
-        return CompositePhysicalProperty(
-            value=self.to_unit(self.reference_unit_mapping["alias"]).value,
-            unit=self.reference_unit_mapping["composite"],
-        )
+        return _to_base_units(self)
 
     def to_si(self) -> CompositePhysicalProperty:
         return self.to_base_units()
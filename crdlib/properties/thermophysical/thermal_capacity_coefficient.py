@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 from enum import Enum, EnumMeta
+from types import MappingProxyType
+from typing import Iterable
 
 
 @dataclass
@@ -17,6 +19,23 @@ class ThermalCapacityCoefficient:
     C: float
     D: float
 
+    def evaluate(self, temperature: float) -> float:
+        """
+        Calculate thermal capacity in cal/mol/K at given temperature in Kelvin.
+        """
+        return (
+            self.A
+            + temperature * (self.B + self.C * temperature)
+            + self.D / (temperature * temperature)
+        )
+
+    def evaluate_many(self, temperatures: Iterable[float]) -> list[float]:
+        """
+        Calculate thermal capacities in cal/mol/K at given temperatures in Kelvin.
+        """
+        A, B, C, D = self.A, self.B, self.C, self.D
+        return [A + T * (B + C * T) + D / (T * T) for T in temperatures]
+
 
 def _create_coefficient(
     symbol: str, A: float, B: float, C: float, D: float
@@ -27,6 +46,8 @@ def _create_coefficient(
 
 _coefficient_map: dict[str, ThermalCapacityCoefficient] = dict()
 
+COEFFICIENTS_BY_SYMBOL = MappingProxyType(_coefficient_map)
+
 
 class ThermalCapacityCoefficientMeta(EnumMeta):
     def __getitem__(self, name: str) -> ThermalCapacityCoefficient:  # type: ignore
@@ -36,10 +57,21 @@ class ThermalCapacityCoefficientMeta(EnumMeta):
 class ThermalCapacityCoefficients(Enum, metaclass=ThermalCapacityCoefficientMeta):
     @staticmethod
     def get(name: str) -> ThermalCapacityCoefficient:
-        return ThermalCapacityCoefficients.__getitem__(name)
+        return _coefficient_map[name]
+
+    @staticmethod
+    def evaluate_all(temperature: float) -> dict[str, float]:
+        """
+        Calculate the thermal capacity in cal/mol/K of every substance at given
+        temperature in Kelvin.
+        """
+        return {
+            name: coefficient.evaluate(temperature)
+            for name, coefficient in _coefficient_map.items()
+        }
 
-    HYDROGEN = _create_coefficient("H2", 6.62, 0.0081, 0, 0)
-    WATER = _create_coefficient("H20", 8.22, 0.00015, 0.00000134, 0)
+    HYDROGEN = _create_coefficient("H2", 6.62, 0.00081, 0, 0)
+    WATER = _create_coefficient("H2O", 8.22, 0.00015, 0.00000134, 0)
     METHANE = _create_coefficient("CH4", 5.34, 0.0115, 0, 0)
     CARBON_MONOXIDE = _create_coefficient("CO", 6.60, 0.00120, 0, 0)
     CARBON_DIOXIDE = _create_coefficient("CO2", 10.34, 0.00274, 0, -195500)
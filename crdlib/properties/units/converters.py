@@ -1,5 +1,7 @@
-from abc import ABCMeta, abstractmethod
-from typing import Protocol, Type
+from abc import ABCMeta
+from functools import partial
+from operator import mul
+from typing import Callable, ClassVar, Protocol, Type
 
 from crdlib.properties.units.units import (
     MeasurementUnit,
@@ -22,6 +24,12 @@ from crdlib.utils.protocols import implements
 
 _converters: dict[GenericUnitDescriptor, Type["PhysicalPropertyUnitConverter"]] = dict()
 
+# conversion factors between composite dimensions; they depend only on the
+# dimensions, thus each one is computed once. Keyed by the numerator and denominator
+# tuples of frozen dimensions rather than by the composites, since composites are
+# mutable.
+_composite_factors: dict[tuple[tuple[Dimension, ...], ...], float] = dict()
+
 
 def get_converter(
     generic: GenericUnitDescriptor,
@@ -88,6 +96,39 @@ def _from_unit_to_gigaunit() -> float:
     return 1 / 1_000_000_000.0
 
 
+def _compose_affine_conversions(
+    to_pivot: dict[MeasurementUnit, tuple[float, float]],
+    from_pivot: dict[MeasurementUnit, tuple[float, float]],
+) -> dict[tuple[MeasurementUnit, MeasurementUnit], tuple[float, float]]:
+    """
+    Compose the (scale, offset) conversions of every pair of units that convert
+    through a common pivot unit; conversions from a unit to itself are exact.
+    """
+    return {
+        (from_unit, to_unit): (
+            (1.0, 0.0)
+            if from_unit is to_unit
+            else (scale * to_scale, offset * to_scale + to_offset)
+        )
+        for from_unit, (scale, offset) in to_pivot.items()
+        for to_unit, (to_scale, to_offset) in from_pivot.items()
+    }
+
+
+def _compose_factors(
+    from_pivot: dict[MeasurementUnit, float]
+) -> dict[tuple[MeasurementUnit, MeasurementUnit], float]:
+    """
+    Compose the conversion factors of every pair of units that convert through a
+    common pivot unit; conversions from a unit to itself are exact.
+    """
+    return {
+        (from_unit, to_unit): 1 if from_unit is to_unit else (1 / factor) * to_factor
+        for from_unit, factor in from_pivot.items()
+        for to_unit, to_factor in from_pivot.items()
+    }
+
+
 class PhysicalPropertyUnitConverter(Protocol):
     """Protocol of classes that convert a value from one unit to another."""
 
@@ -126,11 +167,62 @@ class AbsoluteUnitConverter(metaclass=ABCMeta):
         return value * cls.get_factor(from_descriptor, to_descriptor)
 
     @classmethod
-    @abstractmethod
+    def converter_for(
+        cls, from_descriptor: UnitDescriptor, to_descriptor: UnitDescriptor
+    ) -> Callable[[float], float]:
+        """
+        Create a function that converts values from one unit to another, for
+        callers that convert many values between the same units.
+        """
+        return partial(mul, cls.get_factor(from_descriptor, to_descriptor))
+
+    # measurement unit type of the subclass, e.g. `PressureUnit`
+    _UNIT_TYPE: ClassVar[Type[MeasurementUnit]]
+    # conversion factors from the base unit of the subclass, e.g. from bar
+    _FROM_BASE: ClassVar[dict[MeasurementUnit, float]]
+    _FACTORS: ClassVar[dict[tuple[MeasurementUnit, MeasurementUnit], float]]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._FACTORS = _compose_factors(cls._FROM_BASE)
+
+    @classmethod
     def get_factor(
         cls, from_descriptor: UnitDescriptor, to_descriptor: UnitDescriptor
     ) -> float:
-        ...
+        # valid unit pairs are keys of the table, thus a hit needs no validation.
+        factor = cls._FACTORS.get((from_descriptor, to_descriptor))
+        if factor is not None:
+            return factor
+        if not from_descriptor.isinstance(cls._UNIT_TYPE):
+            raise InvalidUnitConversion(
+                f"cannot convert {cls._unit_type_name()} unit; unknown `from_unit`: "
+                f"{from_descriptor}. "
+            )
+        return cls._FACTORS[
+            (MeasurementUnit.from_descriptor(from_descriptor), cls._unit(to_descriptor))
+        ]
+
+    @classmethod
+    def get_factor_from_base(cls, to_descriptor: UnitDescriptor) -> float:
+        """
+        Conversion factor from the base unit of the converter, e.g. from bar for
+        pressure units.
+        """
+        return cls._FROM_BASE[cls._unit(to_descriptor)]
+
+    @classmethod
+    def _unit(cls, to_descriptor: UnitDescriptor) -> MeasurementUnit:
+        if not to_descriptor.isinstance(cls._UNIT_TYPE):
+            raise InvalidUnitConversion(
+                f"cannot convert {cls._unit_type_name()} unit; unknown `to_unit`: "
+                f"{to_descriptor}. "
+            )
+        return MeasurementUnit.from_descriptor(to_descriptor)
+
+    @classmethod
+    def _unit_type_name(cls) -> str:
+        return cls._UNIT_TYPE.__name__.removesuffix("Unit")
 
 
 class CompositePhysicalPropertyUnitConverter(metaclass=ABCMeta):
@@ -154,9 +246,19 @@ class CompositePhysicalPropertyUnitConverter(metaclass=ABCMeta):
     def get_factor(
         cls, from_dimension: CompositeDimension, to_dimension: CompositeDimension
     ) -> float:
-        return cls.get_numerator_factor(
-            from_dimension, to_dimension
-        ) / cls.get_denominator_factor(from_dimension, to_dimension)
+        key = (
+            from_dimension.numerator,
+            from_dimension.denominator,
+            to_dimension.numerator,
+            to_dimension.denominator,
+        )
+        try:
+            return _composite_factors[key]
+        except KeyError:
+            factor = cls.get_numerator_factor(
+                from_dimension, to_dimension
+            ) / cls.get_denominator_factor(from_dimension, to_dimension)
+            return _composite_factors.setdefault(key, factor)
 
     @staticmethod
     def get_numerator_factor(
@@ -171,7 +273,9 @@ class CompositePhysicalPropertyUnitConverter(metaclass=ABCMeta):
                 )
             converter = get_converter(type(from_d.unit))
             if issubclass(converter, AbsoluteUnitConverter):
-                numerator_factor *= converter.get_factor(from_d.unit, to_d.unit)
+                numerator_factor *= (
+                    converter.get_factor(from_d.unit, to_d.unit) ** from_d.power
+                )
         return numerator_factor
 
     @staticmethod
@@ -188,13 +292,30 @@ class CompositePhysicalPropertyUnitConverter(metaclass=ABCMeta):
                 )
             converter = get_converter(type(from_d.unit))
             if issubclass(converter, AbsoluteUnitConverter):
-                denominator_factor *= converter.get_factor(from_d.unit, to_d.unit)
+                denominator_factor *= (
+                    converter.get_factor(from_d.unit, to_d.unit) ** from_d.power
+                )
         return denominator_factor
 
 
 @implements(PhysicalPropertyUnitConverter)
 @register_converter(TemperatureUnit)
 class TemperatureUnitConverter:
+    # (scale, offset) pairs of the affine conversions to and from Celcius.
+    _TO_CELCIUS = {
+        TemperatureUnit.CELCIUS: (1.0, 0.0),
+        TemperatureUnit.FAHRENHEIT: (1 / 1.8, -32 / 1.8),
+        TemperatureUnit.KELVIN: (1.0, -273.15),
+        TemperatureUnit.RANKINE: (1 / 1.8, -273.15),
+    }
+    _FROM_CELCIUS = {
+        TemperatureUnit.CELCIUS: (1.0, 0.0),
+        TemperatureUnit.FAHRENHEIT: (1.8, 32.0),
+        TemperatureUnit.KELVIN: (1.0, 273.15),
+        TemperatureUnit.RANKINE: (1.8, 273.15 * 1.8),
+    }
+    _CONVERSIONS = _compose_affine_conversions(_TO_CELCIUS, _FROM_CELCIUS)
+
     @classmethod
     def convert(
         cls,
@@ -202,47 +323,46 @@ class TemperatureUnitConverter:
         from_descriptor: UnitDescriptor,
         to_descriptor: UnitDescriptor,
     ) -> float:
+        scale, offset = cls._get_conversion(from_descriptor, to_descriptor)
+        return value * scale + offset
+
+    @classmethod
+    def converter_for(
+        cls, from_descriptor: UnitDescriptor, to_descriptor: UnitDescriptor
+    ) -> Callable[[float], float]:
+        """
+        Create a function that converts values from one unit to another, for
+        callers that convert many values between the same units.
+        """
+        scale, offset = cls._get_conversion(from_descriptor, to_descriptor)
+        return lambda value: value * scale + offset
+
+    @classmethod
+    def _get_conversion(
+        cls, from_descriptor: UnitDescriptor, to_descriptor: UnitDescriptor
+    ) -> tuple[float, float]:
+        # valid unit pairs are keys of the table, thus a hit needs no validation.
+        conversion = cls._CONVERSIONS.get((from_descriptor, to_descriptor))
+        if conversion is not None:
+            return conversion
         if not from_descriptor.isinstance(TemperatureUnit):
             raise InvalidUnitConversion(
                 f"cannot convert Temperature unit; unknown `from_unit`: {to_descriptor}. "
             )
-        unit = MeasurementUnit.from_descriptor(from_descriptor)
-
-        if unit == TemperatureUnit.CELCIUS:
-            return cls.convert_from_celcius(value, to_descriptor)
-        elif unit == TemperatureUnit.FAHRENHEIT:
-            return cls.convert_from_celcius(
-                cls.from_fahrenhet_to_celcius(value), to_descriptor
-            )
-        elif unit == TemperatureUnit.KELVIN:
-            return cls.convert_from_celcius(
-                cls.from_kelvin_to_celcius(value), to_descriptor
-            )
-        elif unit == TemperatureUnit.RANKINE:
-            return cls.convert_from_celcius(
-                cls.from_rankine_to_celcius(value), to_descriptor
-            )
-        else:
-            return 0
-
-    @classmethod
-    def convert_from_celcius(cls, value: float, to_descriptor: UnitDescriptor) -> float:
         if not to_descriptor.isinstance(TemperatureUnit):
             raise InvalidUnitConversion(
                 f"cannot convert Temperature unit; unknown `to_unit`: {to_descriptor}. "
             )
-        unit = MeasurementUnit.from_descriptor(to_descriptor)
+        return cls._CONVERSIONS[
+            (
+                MeasurementUnit.from_descriptor(from_descriptor),
+                MeasurementUnit.from_descriptor(to_descriptor),
+            )
+        ]
 
-        if unit == TemperatureUnit.CELCIUS:
-            return value
-        elif unit == TemperatureUnit.FAHRENHEIT:
-            return cls.from_celcius_to_fahrenheit(value)
-        elif unit == TemperatureUnit.KELVIN:
-            return cls.from_celcius_to_kelvin(value)
-        elif unit == TemperatureUnit.RANKINE:
-            return cls.from_celcius_to_rankine(value)
-        else:
-            return 0
+    @classmethod
+    def convert_from_celcius(cls, value: float, to_descriptor: UnitDescriptor) -> float:
+        return cls.convert(value, TemperatureUnit.CELCIUS, to_descriptor)
 
     @staticmethod
     def from_celcius_to_kelvin(celcius: float) -> float:
@@ -275,49 +395,18 @@ class AliasedPressureUnitConverter(AbsoluteUnitConverter):
     BAR_TO_PASCAL = 100_000
     BAR_TO_KILOPASCAL = 100
 
-    @classmethod
-    def get_factor(
-        cls, from_descriptor: UnitDescriptor, to_descriptor: UnitDescriptor
-    ) -> float:
-        if not from_descriptor.isinstance(PressureUnit):
-            raise InvalidUnitConversion(
-                f"cannot convert Pressure unit; unknown `from_unit`: {to_descriptor}. "
-            )
-        unit = MeasurementUnit.from_descriptor(from_descriptor)
-
-        if unit == PressureUnit.BAR:
-            return cls.get_factor_from_bar(to_descriptor)
-        elif unit == PressureUnit.MILLI_BAR:
-            return _from_milliunit_to_unit() * cls.get_factor_from_bar(to_descriptor)
-        elif unit == PressureUnit.PSI:
-            return (1 / cls.BAR_TO_PSI) * cls.get_factor_from_bar(to_descriptor)
-        elif unit == PressureUnit.PASCAL:
-            return (1 / cls.BAR_TO_PASCAL) * cls.get_factor_from_bar(to_descriptor)
-        elif unit == PressureUnit.KILO_PASCAL:
-            return (1 / cls.BAR_TO_KILOPASCAL) * cls.get_factor_from_bar(to_descriptor)
-        else:
-            return 0
+    _UNIT_TYPE = PressureUnit
+    _FROM_BASE = {
+        PressureUnit.BAR: 1,
+        PressureUnit.MILLI_BAR: _from_unit_to_milliunit(),
+        PressureUnit.PSI: BAR_TO_PSI,
+        PressureUnit.PASCAL: BAR_TO_PASCAL,
+        PressureUnit.KILO_PASCAL: BAR_TO_KILOPASCAL,
+    }
 
     @classmethod
     def get_factor_from_bar(cls, to_descriptor: UnitDescriptor) -> float:
-        if not to_descriptor.isinstance(PressureUnit):
-            raise InvalidUnitConversion(
-                f"cannot convert Pressure unit; unknown `to_unit`: {to_descriptor}. "
-            )
-        unit = MeasurementUnit.from_descriptor(to_descriptor)
-
-        if unit == PressureUnit.BAR:
-            return 1
-        elif unit == PressureUnit.MILLI_BAR:
-            return _from_unit_to_milliunit()
-        elif unit == PressureUnit.PSI:
-            return cls.BAR_TO_PSI
-        elif unit == PressureUnit.PASCAL:
-            return cls.BAR_TO_PASCAL
-        elif unit == PressureUnit.KILO_PASCAL:
-            return _from_unit_to_kilounit()
-        else:
-            return 0
+        return cls.get_factor_from_base(to_descriptor)
 
 
 @register_converter(LengthUnit)
@@ -325,53 +414,19 @@ class LengthUnitConverter(AbsoluteUnitConverter):
     METER_TO_INCH = 39.37
     METER_TO_FOOT = 3.281
 
-    @classmethod
-    def get_factor(
-        cls, from_descriptor: UnitDescriptor, to_descriptor: UnitDescriptor
-    ) -> float:
-        if not from_descriptor.isinstance(LengthUnit):
-            raise InvalidUnitConversion(
-                f"cannot convert Length unit; unknown `from_unit`: {from_descriptor}. "
-            )
-        unit = MeasurementUnit.from_descriptor(from_descriptor)
-
-        if unit == LengthUnit.METER:
-            return cls.get_factor_from_meter(to_descriptor)
-        elif unit == LengthUnit.MILLI_METER:
-            return _from_milliunit_to_unit() * cls.get_factor_from_meter(to_descriptor)
-        elif unit == LengthUnit.CENTI_METER:
-            return _from_centiunit_to_unit() * cls.get_factor_from_meter(to_descriptor)
-        elif unit == LengthUnit.KILO_METER:
-            return _from_kilounit_to_unit() * cls.get_factor_from_meter(to_descriptor)
-        elif unit == LengthUnit.INCH:
-            return (1 / cls.METER_TO_INCH) * cls.get_factor_from_meter(to_descriptor)
-        elif unit == LengthUnit.FOOT:
-            return (1 / cls.METER_TO_FOOT) * cls.get_factor_from_meter(to_descriptor)
-        else:
-            return 0
+    _UNIT_TYPE = LengthUnit
+    _FROM_BASE = {
+        LengthUnit.METER: 1,
+        LengthUnit.MILLI_METER: _from_unit_to_milliunit(),
+        LengthUnit.CENTI_METER: _from_unit_to_centiunit(),
+        LengthUnit.KILO_METER: _from_unit_to_kilounit(),
+        LengthUnit.INCH: METER_TO_INCH,
+        LengthUnit.FOOT: METER_TO_FOOT,
+    }
 
     @classmethod
     def get_factor_from_meter(cls, to_descriptor: UnitDescriptor) -> float:
-        if not to_descriptor.isinstance(LengthUnit):
-            raise InvalidUnitConversion(
-                f"cannot convert Length unit; unknown `to_unit`: {to_descriptor}.  "
-            )
-        unit = MeasurementUnit.from_descriptor(to_descriptor)
-
-        if unit == LengthUnit.METER:
-            return 1
-        elif unit == LengthUnit.MILLI_METER:
-            return _from_unit_to_milliunit()
-        elif unit == LengthUnit.CENTI_METER:
-            return _from_unit_to_centiunit()
-        elif unit == LengthUnit.KILO_METER:
-            return _from_unit_to_kilounit()
-        elif unit == LengthUnit.INCH:
-            return cls.METER_TO_INCH
-        elif unit == LengthUnit.FOOT:
-            return cls.METER_TO_FOOT
-        else:
-            return 0
+        return cls.get_factor_from_base(to_descriptor)
 
 
 @register_converter(MassUnit)
@@ -380,92 +435,31 @@ class MassUnitConverter(AbsoluteUnitConverter):
     KILOGRAM_TO_METRIC_TONNE = 1 / 1_000
     KILOGRAM_TO_POUND = 2.205
 
-    @classmethod
-    def get_factor(
-        cls, from_descriptor: UnitDescriptor, to_descriptor: UnitDescriptor
-    ) -> float:
-        if not from_descriptor.isinstance(MassUnit):
-            raise InvalidUnitConversion(
-                f"cannot convert Mass unit; unknown `from_unit`: {from_descriptor}. "
-            )
-        unit = MeasurementUnit.from_descriptor(from_descriptor)
-
-        if unit == MassUnit.KILO_GRAM:
-            return cls.get_factor_from_kilogram(to_descriptor)
-        elif unit == MassUnit.MILLI_GRAM:
-            return (1 / cls.KILOGRAM_TO_MILLIGRAM) * cls.get_factor_from_kilogram(
-                to_descriptor
-            )
-        elif unit == MassUnit.GRAM:
-            return _from_unit_to_kilounit() * cls.get_factor_from_kilogram(
-                to_descriptor
-            )
-        elif unit == MassUnit.METRIC_TONNE:
-            return (1 / cls.KILOGRAM_TO_METRIC_TONNE) * cls.get_factor_from_kilogram(
-                to_descriptor
-            )
-        elif unit == MassUnit.POUND:
-            return (1 / cls.KILOGRAM_TO_POUND) * cls.get_factor_from_kilogram(
-                to_descriptor
-            )
-        else:
-            return 0
+    _UNIT_TYPE = MassUnit
+    _FROM_BASE = {
+        MassUnit.KILO_GRAM: 1,
+        MassUnit.MILLI_GRAM: KILOGRAM_TO_MILLIGRAM,
+        MassUnit.GRAM: _from_kilounit_to_unit(),
+        MassUnit.METRIC_TONNE: KILOGRAM_TO_METRIC_TONNE,
+        MassUnit.POUND: KILOGRAM_TO_POUND,
+    }
 
     @classmethod
     def get_factor_from_kilogram(cls, to_descriptor: UnitDescriptor) -> float:
-        if not to_descriptor.isinstance(MassUnit):
-            raise InvalidUnitConversion(
-                f"cannot convert Mass unit; unknown `to_unit`: {to_descriptor}. "
-            )
-        unit = MeasurementUnit.from_descriptor(to_descriptor)
-
-        if unit == MassUnit.KILO_GRAM:
-            return 1
-        elif unit == MassUnit.MILLI_GRAM:
-            return cls.KILOGRAM_TO_MILLIGRAM
-        elif unit == MassUnit.GRAM:
-            return _from_kilounit_to_unit()
-        elif unit == MassUnit.METRIC_TONNE:
-            return cls.KILOGRAM_TO_METRIC_TONNE
-        elif unit == MassUnit.POUND:
-            return cls.KILOGRAM_TO_POUND
-        else:
-            return 0
+        return cls.get_factor_from_base(to_descriptor)
 
 
 @register_converter(AmountUnit)
 class AmountUnitConverter(AbsoluteUnitConverter):
-    @classmethod
-    def get_factor(
-        cls, from_descriptor: UnitDescriptor, to_descriptor: UnitDescriptor
-    ) -> float:
-        if not from_descriptor.isinstance(AmountUnit):
-            raise InvalidUnitConversion(
-                f"cannot convert Amount unit; unknown `from_unit`: {from_descriptor}. "
-            )
-        unit = MeasurementUnit.from_descriptor(from_descriptor)
-
-        if unit == AmountUnit.MOL:
-            return cls.get_factor_from_mol(to_descriptor)
-        elif unit == AmountUnit.KILO_MOL:
-            return _from_kilounit_to_unit() * cls.get_factor_from_mol(to_descriptor)
-        else:
-            return 0
+    _UNIT_TYPE = AmountUnit
+    _FROM_BASE = {
+        AmountUnit.MOL: 1,
+        AmountUnit.KILO_MOL: _from_unit_to_kilounit(),
+    }
 
     @classmethod
     def get_factor_from_mol(cls, to_descriptor: UnitDescriptor) -> float:
-        if not to_descriptor.isinstance(AmountUnit):
-            raise InvalidUnitConversion(
-                f"cannot convert Amount unit; unknown `to_unit`: {to_descriptor}. "
-            )
-        unit = MeasurementUnit.from_descriptor(to_descriptor)
-
-        if unit == AmountUnit.MOL:
-            return 1
-        elif unit == AmountUnit.KILO_MOL:
-            return _from_unit_to_kilounit()
-        else:
-            return 0
+        return cls.get_factor_from_base(to_descriptor)
 
 
 @register_converter(TimeUnit)
@@ -474,51 +468,18 @@ class TimeUnitConverter(AbsoluteUnitConverter):
     SECOND_TO_HOUR = 1 / 60.0 / 60
     SECOND_TO_DAY = 1 / 60.0 / 60 / 24
 
-    @classmethod
-    def get_factor(
-        cls, from_descriptor: UnitDescriptor, to_descriptor: UnitDescriptor
-    ) -> float:
-        if not from_descriptor.isinstance(TimeUnit):
-            raise InvalidUnitConversion(
-                f"cannot convert Time unit; unknown `from_unit`: {from_descriptor}. "
-            )
-        unit = MeasurementUnit.from_descriptor(from_descriptor)
-
-        if unit == TimeUnit.SECOND:
-            return cls.get_factor_from_second(to_descriptor)
-        elif unit == TimeUnit.MILLI_SECOND:
-            return _from_milliunit_to_unit() * cls.get_factor_from_second(to_descriptor)
-        elif unit == TimeUnit.MINUTE:
-            return (1 / cls.SECOND_TO_MINUTE) * cls.get_factor_from_second(
-                to_descriptor
-            )
-        elif unit == TimeUnit.HOUR:
-            return (1 / cls.SECOND_TO_HOUR) * cls.get_factor_from_second(to_descriptor)
-        elif unit == TimeUnit.DAY:
-            return (1 / cls.SECOND_TO_DAY) * cls.get_factor_from_second(to_descriptor)
-        else:
-            return 0
+    _UNIT_TYPE = TimeUnit
+    _FROM_BASE = {
+        TimeUnit.SECOND: 1,
+        TimeUnit.MILLI_SECOND: _from_unit_to_milliunit(),
+        TimeUnit.MINUTE: SECOND_TO_MINUTE,
+        TimeUnit.HOUR: SECOND_TO_HOUR,
+        TimeUnit.DAY: SECOND_TO_DAY,
+    }
 
     @classmethod
     def get_factor_from_second(cls, to_descriptor: UnitDescriptor) -> float:
-        if not to_descriptor.isinstance(TimeUnit):
-            raise InvalidUnitConversion(
-                f"cannot convert Time unit; unknown `to_unit`: {to_descriptor}. "
-            )
-        unit = MeasurementUnit.from_descriptor(to_descriptor)
-
-        if unit == TimeUnit.SECOND:
-            return 1
-        elif unit == TimeUnit.MILLI_SECOND:
-            return _from_unit_to_milliunit()
-        elif unit == TimeUnit.MINUTE:
-            return cls.SECOND_TO_MINUTE
-        elif unit == TimeUnit.HOUR:
-            return cls.SECOND_TO_HOUR
-        elif unit == TimeUnit.DAY:
-            return cls.SECOND_TO_DAY
-        else:
-            return 0
+        return cls.get_factor_from_base(to_descriptor)
 
 
 @register_converter(EnergyUnit)
@@ -527,55 +488,19 @@ class EnergyUnitConverter(AbsoluteUnitConverter):
     JOULE_TO_KILOCALORIE = 1 / 4.184 / 1_000
     JOULE_TO_BTU = 1 / 1055
 
-    @classmethod
-    def get_factor(
-        cls, from_descriptor: UnitDescriptor, to_descriptor: UnitDescriptor
-    ) -> float:
-        if not from_descriptor.isinstance(EnergyUnit):
-            raise InvalidUnitConversion(
-                f"cannot convert Energy unit; unknown `from_unit`: {from_descriptor}. "
-            )
-        unit = MeasurementUnit.from_descriptor(from_descriptor)
-
-        if unit == EnergyUnit.JOULE:
-            return cls.get_factor_from_joule(to_descriptor)
-        elif unit == EnergyUnit.KILO_JOULE:
-            return _from_kilounit_to_unit() * cls.get_factor_from_joule(to_descriptor)
-        elif unit == EnergyUnit.GIGA_JOULE:
-            return _from_gigaunit_to_unit() * cls.get_factor_from_joule(to_descriptor)
-        elif unit == EnergyUnit.CALORIE:
-            return (1 / cls.JOULE_TO_CALORIE) * cls.get_factor_from_joule(to_descriptor)
-        elif unit == EnergyUnit.KILO_CALORIE:
-            return (1 / cls.JOULE_TO_KILOCALORIE) * cls.get_factor_from_joule(
-                to_descriptor
-            )
-        elif unit == EnergyUnit.BTU:
-            return (cls.JOULE_TO_BTU) * cls.get_factor_from_joule(to_descriptor)
-        else:
-            return 0
+    _UNIT_TYPE = EnergyUnit
+    _FROM_BASE = {
+        EnergyUnit.JOULE: 1,
+        EnergyUnit.KILO_JOULE: _from_unit_to_kilounit(),
+        EnergyUnit.GIGA_JOULE: _from_unit_to_gigaunit(),
+        EnergyUnit.CALORIE: JOULE_TO_CALORIE,
+        EnergyUnit.KILO_CALORIE: JOULE_TO_KILOCALORIE,
+        EnergyUnit.BTU: JOULE_TO_BTU,
+    }
 
     @classmethod
     def get_factor_from_joule(cls, to_descriptor: UnitDescriptor) -> float:
-        if not to_descriptor.isinstance(EnergyUnit):
-            raise InvalidUnitConversion(
-                f"cannot convert Energy unit; unknown `to_unit`: {to_descriptor}. "
-            )
-        unit = MeasurementUnit.from_descriptor(to_descriptor)
-
-        if unit == EnergyUnit.JOULE:
-            return 1
-        elif unit == EnergyUnit.KILO_JOULE:
-            return _from_unit_to_kilounit()
-        elif unit == EnergyUnit.GIGA_JOULE:
-            return _from_gigaunit_to_unit()
-        elif unit == EnergyUnit.CALORIE:
-            return cls.JOULE_TO_CALORIE
-        elif unit == EnergyUnit.KILO_CALORIE:
-            return cls.JOULE_TO_KILOCALORIE
-        elif unit == EnergyUnit.BTU:
-            return cls.JOULE_TO_BTU
-        else:
-            return 0
+        return cls.get_factor_from_base(to_descriptor)
 
 
 @implements(PhysicalPropertyUnitConverter)
@@ -595,6 +520,8 @@ class VolumeUnitConverter:
                 f"invalid Volume unit conversion; cannot convert from {from_descriptor}"
                 f" to {to_descriptor}"
             )
+        if from_descriptor == to_descriptor:
+            return value
         from_dimension = Dimension.from_descriptor(from_descriptor)
         to_dimension = Dimension.from_descriptor(to_descriptor)
         factor = LengthUnitConverter.get_factor(from_dimension.unit, to_dimension.unit)
@@ -604,6 +531,8 @@ class VolumeUnitConverter:
 @implements(PhysicalPropertyUnitConverter)
 @register_converter(MassUnit / TimeUnit)
 class MassRateUnitConverter(CompositePhysicalPropertyUnitConverter):
+    _GENERIC = MassUnit / TimeUnit
+
     @classmethod
     def convert(
         cls,
@@ -611,13 +540,15 @@ class MassRateUnitConverter(CompositePhysicalPropertyUnitConverter):
         from_descriptor: UnitDescriptor,
         to_descriptor: UnitDescriptor,
     ) -> float:
-        if (not to_descriptor.isinstance(MassUnit / TimeUnit)) or (
-            not from_descriptor.isinstance(MassUnit / TimeUnit)
+        if (not to_descriptor.isinstance(cls._GENERIC)) or (
+            not from_descriptor.isinstance(cls._GENERIC)
         ):
             raise InvalidUnitConversion(
                 "invalid MassRate unit conversion; cannot convert from"
                 f" {from_descriptor} to {to_descriptor}. "
             )
+        if from_descriptor == to_descriptor:
+            return value
         from_dimension = CompositeDimension.from_descriptor(from_descriptor)
         to_dimension = CompositeDimension.from_descriptor(to_descriptor)
         return value * cls.get_factor(from_dimension, to_dimension)
@@ -626,6 +557,8 @@ class MassRateUnitConverter(CompositePhysicalPropertyUnitConverter):
 @implements(PhysicalPropertyUnitConverter)
 @register_converter((LengthUnit**3) / AmountUnit)
 class MolarVolumeUnitConverter(CompositePhysicalPropertyUnitConverter):
+    _GENERIC = (LengthUnit**3) / AmountUnit
+
     @classmethod
     def convert(
         cls,
@@ -633,14 +566,15 @@ class MolarVolumeUnitConverter(CompositePhysicalPropertyUnitConverter):
         from_descriptor: UnitDescriptor,
         to_descriptor: UnitDescriptor,
     ) -> float:
-        generic = (LengthUnit**3) / AmountUnit
-        if (not to_descriptor.isinstance(generic)) or (
-            not from_descriptor.isinstance(generic)
+        if (not to_descriptor.isinstance(cls._GENERIC)) or (
+            not from_descriptor.isinstance(cls._GENERIC)
         ):
             raise InvalidUnitConversion(
                 "invalid MolarVolume unit conversion; cannot convert from"
                 f" {from_descriptor} to {to_descriptor}. "
             )
+        if from_descriptor == to_descriptor:
+            return value
         from_dimension = CompositeDimension.from_descriptor(from_descriptor)
         to_dimension = CompositeDimension.from_descriptor(to_descriptor)
         return value * cls.get_factor(from_dimension, to_dimension)
@@ -649,6 +583,8 @@ class MolarVolumeUnitConverter(CompositePhysicalPropertyUnitConverter):
 @implements(PhysicalPropertyUnitConverter)
 @register_converter(EnergyUnit / AmountUnit)
 class AliasedMolarEnergyUnitConverter(CompositePhysicalPropertyUnitConverter):
+    _GENERIC = EnergyUnit / AmountUnit
+
     @classmethod
     def convert(
         cls,
@@ -656,14 +592,15 @@ class AliasedMolarEnergyUnitConverter(CompositePhysicalPropertyUnitConverter):
         from_descriptor: UnitDescriptor,
         to_descriptor: UnitDescriptor,
     ) -> float:
-        generic = EnergyUnit / AmountUnit
-        if (not to_descriptor.isinstance(generic)) or (
-            not from_descriptor.isinstance(generic)
+        if (not to_descriptor.isinstance(cls._GENERIC)) or (
+            not from_descriptor.isinstance(cls._GENERIC)
         ):
             raise InvalidUnitConversion(
                 "invalid MolarEnergy unit conversion; cannot convert from "
                 f"{from_descriptor} to {to_descriptor}. "
             )
+        if from_descriptor == to_descriptor:
+            return value
         from_dimension = CompositeDimension.from_descriptor(from_descriptor)
         to_dimension = CompositeDimension.from_descriptor(to_descriptor)
         return value * cls.get_factor(from_dimension, to_dimension)
@@ -674,6 +611,10 @@ class AliasedMolarEnergyUnitConverter(CompositePhysicalPropertyUnitConverter):
     MassUnit * (LengthUnit**2) / (TimeUnit**2) / TemperatureUnit / AmountUnit
 )
 class GasConstantUnitConverter(CompositePhysicalPropertyUnitConverter):
+    _GENERIC = (
+        MassUnit * (LengthUnit**2) / (TimeUnit**2) / TemperatureUnit / AmountUnit
+    )
+
     @classmethod
     def convert(
         cls,
@@ -681,20 +622,15 @@ class GasConstantUnitConverter(CompositePhysicalPropertyUnitConverter):
         from_descriptor: UnitDescriptor,
         to_descriptor: UnitDescriptor,
     ) -> float:
-        generic = (
-            MassUnit
-            * (LengthUnit**2)
-            / (TimeUnit**2)
-            / TemperatureUnit
-            / AmountUnit
-        )
-        if (not to_descriptor.isinstance(generic)) or (
-            not from_descriptor.isinstance(generic)
+        if (not to_descriptor.isinstance(cls._GENERIC)) or (
+            not from_descriptor.isinstance(cls._GENERIC)
         ):
             raise InvalidUnitConversion(
                 "invalid GasConstant unit conversion; cannot convert from "
                 f"{from_descriptor} to {to_descriptor}. "
             )
+        if from_descriptor == to_descriptor:
+            return value
         from_dimension = CompositeDimension.from_descriptor(from_descriptor)
         to_dimension = CompositeDimension.from_descriptor(to_descriptor)
         return value * cls.get_factor(from_dimension, to_dimension)
@@ -703,6 +639,8 @@ class GasConstantUnitConverter(CompositePhysicalPropertyUnitConverter):
 @implements(PhysicalPropertyUnitConverter)
 @register_converter(MassUnit / LengthUnit / (TimeUnit**2))
 class PressureUnitConverter(CompositePhysicalPropertyUnitConverter):
+    _GENERIC = MassUnit / LengthUnit / (TimeUnit**2)
+
     @classmethod
     def convert(
         cls,
@@ -710,14 +648,15 @@ class PressureUnitConverter(CompositePhysicalPropertyUnitConverter):
         from_descriptor: UnitDescriptor,
         to_descriptor: UnitDescriptor,
     ) -> float:
-        generic = MassUnit / LengthUnit / (TimeUnit**2)
-        if (not to_descriptor.isinstance(generic)) or (
-            not from_descriptor.isinstance(generic)
+        if (not to_descriptor.isinstance(cls._GENERIC)) or (
+            not from_descriptor.isinstance(cls._GENERIC)
         ):
             raise InvalidUnitConversion(
                 "invalid Pressure unit conversion; cannot convert from "
                 f"{from_descriptor} to {to_descriptor}."
             )
+        if from_descriptor == to_descriptor:
+            return value
         from_dimension = CompositeDimension.from_descriptor(from_descriptor)
         to_dimension = CompositeDimension.from_descriptor(to_descriptor)
         return value * cls.get_factor(from_dimension, to_dimension)
@@ -726,6 +665,8 @@ class PressureUnitConverter(CompositePhysicalPropertyUnitConverter):
 @implements(PhysicalPropertyUnitConverter)
 @register_converter(MassUnit / LengthUnit / (TimeUnit**2) / AmountUnit)
 class MolarEnergyUnitConverter(CompositePhysicalPropertyUnitConverter):
+    _GENERIC = MassUnit / LengthUnit / (TimeUnit**2) / AmountUnit
+
     @classmethod
     def convert(
         cls,
@@ -733,14 +674,15 @@ class MolarEnergyUnitConverter(CompositePhysicalPropertyUnitConverter):
         from_descriptor: UnitDescriptor,
         to_descriptor: UnitDescriptor,
     ) -> float:
-        generic = MassUnit / LengthUnit / (TimeUnit**2) / AmountUnit
-        if (not to_descriptor.isinstance(generic)) or (
-            not from_descriptor.isinstance(generic)
+        if (not to_descriptor.isinstance(cls._GENERIC)) or (
+            not from_descriptor.isinstance(cls._GENERIC)
         ):
             raise InvalidUnitConversion(
                 "invalid MolarEnergy unit conversion; cannot convert from "
                 f"{from_descriptor} to {to_descriptor}."
             )
+        if from_descriptor == to_descriptor:
+            return value
         from_dimension = CompositeDimension.from_descriptor(from_descriptor)
         to_dimension = CompositeDimension.from_descriptor(to_descriptor)
         return value * cls.get_factor(from_dimension, to_dimension)
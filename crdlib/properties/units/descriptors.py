@@ -8,7 +8,19 @@ A generic unit descriptor is an interface that describes a generic measurement u
 can represent e.g. a temperature unit, a volume unit, a reaction rate unit etc.
 """
 from enum import Enum, EnumMeta
-from typing import List, Union, Protocol, TypeAlias, Optional, TypeVar
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Tuple,
+    Union,
+    Protocol,
+    TypeAlias,
+    Optional,
+    TypeVar,
+)
 from dataclasses import dataclass, field
 
 from crdlib.properties.exceptions import (
@@ -86,22 +98,20 @@ class MeasurementUnitMeta(EnumMeta):
 
     def __mul__(unit_cls, other: GenericUnitDescriptor) -> "GenericCompositeDimension":
         if isinstance(other, GenericCompositeDimension):
-            numerator = other.numerator.copy()
-            denominator = other.denominator.copy()
-            numerator.append(GenericDimension(unit_cls))
             return GenericCompositeDimension(
-                numerator=numerator, denominator=denominator
+                numerator=(*other.numerator, _generic_dimension(unit_cls)),
+                denominator=other.denominator,
             )
         elif isinstance(other, GenericDimension):
             return GenericCompositeDimension(
-                numerator=[GenericDimension(unit_cls), other]
+                numerator=(_generic_dimension(unit_cls), other)
             )
-        elif type(other) == MeasurementUnitType:
+        elif isinstance(other, MeasurementUnitMeta):
             return GenericCompositeDimension(
-                numerator=[
-                    GenericDimension(unit_cls),
-                    GenericDimension(other),
-                ]
+                numerator=(
+                    _generic_dimension(unit_cls),
+                    _generic_dimension(other),
+                )
             )
         raise InvalidUnitDescriptorBinaryOperation(
             f"cannot multiply {unit_cls} with {other}. "
@@ -111,20 +121,18 @@ class MeasurementUnitMeta(EnumMeta):
         unit_cls, other: GenericUnitDescriptor
     ) -> "GenericCompositeDimension":
         if isinstance(other, GenericCompositeDimension):
-            numerator = other.denominator.copy()
-            denominator = other.numerator.copy()
-            numerator.append(GenericDimension(unit_cls))
             return GenericCompositeDimension(
-                numerator=numerator, denominator=denominator
+                numerator=(*other.denominator, _generic_dimension(unit_cls)),
+                denominator=other.numerator,
             )
         elif isinstance(other, GenericDimension):
             return GenericCompositeDimension(
-                numerator=[GenericDimension(unit_cls)], denominator=[other]
+                numerator=(_generic_dimension(unit_cls),), denominator=(other,)
             )
-        elif type(other) == MeasurementUnitType:
+        elif isinstance(other, MeasurementUnitMeta):
             return GenericCompositeDimension(
-                numerator=[GenericDimension(unit_cls)],
-                denominator=[GenericDimension(other)],
+                numerator=(_generic_dimension(unit_cls),),
+                denominator=(_generic_dimension(other),),
             )
         raise InvalidUnitDescriptorBinaryOperation(
             f"cannot divide {unit_cls} with {other}. "
@@ -172,33 +180,34 @@ class MeasurementUnit(Enum, metaclass=MeasurementUnitMeta):
 
     def __mul__(self, descriptor: UnitDescriptor) -> "CompositeDimension":
         if isinstance(descriptor, MeasurementUnit):
-            return Dimension(self) * Dimension(descriptor)
+            return _dimension(self) * _dimension(descriptor)
         elif isinstance(descriptor, (Dimension, CompositeDimension)):
-            return Dimension(self) * descriptor
+            return _dimension(self) * descriptor
         raise InvalidUnitDescriptorBinaryOperation(
             f"cannot multiply {self} with {descriptor}. "
         )
 
     def __truediv__(self, descriptor: UnitDescriptor) -> "CompositeDimension":
         if isinstance(descriptor, MeasurementUnit):
-            return Dimension(self) / Dimension(descriptor)
+            return _dimension(self) / _dimension(descriptor)
         elif isinstance(descriptor, (Dimension, CompositeDimension)):
-            return Dimension(self) / descriptor
+            return _dimension(self) / descriptor
         raise InvalidUnitDescriptorBinaryOperation(
             f"cannot divide {self} with {descriptor}. "
         )
 
     def __pow__(self, power: Union[float, int]) -> "Dimension":
-        return Dimension(self) ** power
+        return _dimension(self) ** power
 
-    def __hash__(self) -> int:
-        return hash(self.value)
+    # members are singletons that compare by identity, thus the identity hash is
+    # consistent with equality and avoids a Python-level call per dict lookup.
+    __hash__ = object.__hash__
 
     def __repr__(self) -> str:
         return str(self)
 
     def __str__(self) -> str:
-        return self.value
+        return self._value_
 
 
 # mypy does treat Type[MeasurementUnit] and MeasurementUnitMeta as equals.
@@ -231,7 +240,7 @@ class AliasedMeasurementUnit(MeasurementUnit):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 @implements(GenericUnitDescriptor)
 class GenericDimension:
     """
@@ -244,19 +253,19 @@ class GenericDimension:
     unit_type: MeasurementUnitType
     power: Union[float, int] = 1
 
+    # lazily computed cache
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
     def __mul__(self, generic: GenericUnitDescriptor) -> "GenericCompositeDimension":
         if isinstance(generic, GenericCompositeDimension):
-            numerator = generic.numerator.copy()
-            denominator = generic.denominator.copy()
-            numerator.append(self)
             return GenericCompositeDimension(
-                numerator=numerator, denominator=denominator
+                numerator=(*generic.numerator, self), denominator=generic.denominator
             )
         elif isinstance(generic, GenericDimension):
-            return GenericCompositeDimension(numerator=[self, generic])
-        elif type(generic) == MeasurementUnitType:
+            return GenericCompositeDimension(numerator=(self, generic))
+        elif isinstance(generic, MeasurementUnitMeta):
             return GenericCompositeDimension(
-                numerator=[self, GenericDimension(generic)]
+                numerator=(self, _generic_dimension(generic))
             )
         raise InvalidUnitDescriptorBinaryOperation(
             f"cannot multiply {self} with {generic}. "
@@ -266,25 +275,21 @@ class GenericDimension:
         self, generic: GenericUnitDescriptor
     ) -> "GenericCompositeDimension":
         if isinstance(generic, GenericCompositeDimension):
-            numerator = generic.denominator.copy()
-            denominator = generic.numerator.copy()
-            numerator.append(self)
             return GenericCompositeDimension(
-                numerator=numerator, denominator=denominator
+                numerator=(*generic.denominator, self), denominator=generic.numerator
             )
         elif isinstance(generic, GenericDimension):
-            return GenericCompositeDimension(numerator=[self], denominator=[generic])
-        elif type(generic) == MeasurementUnitType:
+            return GenericCompositeDimension(numerator=(self,), denominator=(generic,))
+        elif isinstance(generic, MeasurementUnitMeta):
             return GenericCompositeDimension(
-                numerator=[self], denominator=[GenericDimension(generic)]
+                numerator=(self,), denominator=(_generic_dimension(generic),)
             )
         raise InvalidUnitDescriptorBinaryOperation(
             f"cannot divide {self} with {generic}. "
         )
 
     def __pow__(self, power: Union[float, int]) -> "GenericDimension":
-        self.power *= power
-        return self
+        return GenericDimension(self.unit_type, self.power * power)
 
     def __eq__(self, generic) -> bool:
         if not isinstance(generic, GenericDimension):
@@ -292,10 +297,12 @@ class GenericDimension:
         return self.unit_type == generic.unit_type and self.power == generic.power
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        if self._hash is None:
+            self._hash = hash((self.unit_type, self.power))
+        return self._hash
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 @implements(UnitDescriptor)
 class Dimension:
     """
@@ -314,8 +321,37 @@ class Dimension:
     unit: MeasurementUnit
     power: Union[float, int] = 1
 
-    def __init__(self, unit: MeasurementUnit) -> None:
-        self.unit = unit
+    # lazily computed caches
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __new__(
+        cls, unit: Optional[MeasurementUnit] = None, power: Union[float, int] = 1
+    ) -> "Dimension":
+        # dimensions to the 1st power are interned, which is safe since dimensions
+        # are frozen. Fields are set here rather than in `__init__`, so that a shared
+        # dimension is not initialized again on every `Dimension(unit)` call.
+        if power == 1:
+            dimension = _dimensions.get(unit)  # type: ignore[arg-type]
+            if dimension is not None:
+                return dimension
+        dimension = object.__new__(cls)
+        if unit is None:
+            # e.g. unpickling or copying, which set the fields afterwards
+            return dimension
+        object.__setattr__(dimension, "unit", unit)
+        object.__setattr__(dimension, "power", power)
+        object.__setattr__(dimension, "_hash", None)
+        object.__setattr__(dimension, "_str", None)
+        if power == 1:
+            return _dimensions.setdefault(unit, dimension)
+        return dimension
+
+    def __init__(
+        self, unit: Optional[MeasurementUnit] = None, power: Union[float, int] = 1
+    ) -> None:
+        # fields are set by `__new__`
+        pass
 
     @staticmethod
     def from_descriptor(descriptor: UnitDescriptor) -> "Dimension":
@@ -328,14 +364,14 @@ class Dimension:
         if isinstance(descriptor, Dimension):
             return descriptor
         elif isinstance(descriptor, MeasurementUnit):
-            return Dimension(descriptor)
+            return _dimension(descriptor)
         raise WrongUnitDescriptorType(
             f"cannot create Dimension from descriptor: {descriptor}"
         )
 
     def isinstance(self, generic: GenericUnitDescriptor) -> bool:
-        if type(generic) == MeasurementUnitType:
-            generic = GenericDimension(generic)
+        if isinstance(generic, MeasurementUnitMeta):
+            generic = _generic_dimension(generic)
         if not isinstance(generic, GenericDimension):
             return False
         if isinstance(self.unit, generic.unit_type) and self.power == generic.power:
@@ -343,33 +379,35 @@ class Dimension:
         return False
 
     def to_generic(self) -> GenericDimension:
+        if self.power == 1:
+            return _generic_dimension(type(self.unit))
         return GenericDimension(type(self.unit), self.power)
 
     def __mul__(self, descriptor: "UnitDescriptor") -> "CompositeDimension":
         if isinstance(descriptor, CompositeDimension):
-            numerator = descriptor.numerator.copy()
-            denominator = descriptor.denominator.copy()
-            numerator.append(self)
-            return CompositeDimension(numerator=numerator, denominator=denominator)
+            return CompositeDimension(
+                numerator=(*descriptor.numerator, self),
+                denominator=descriptor.denominator,
+            )
         elif isinstance(descriptor, Dimension):
-            return CompositeDimension(numerator=[self, descriptor])
+            return CompositeDimension(numerator=(self, descriptor))
         elif isinstance(descriptor, MeasurementUnit):
-            return CompositeDimension(numerator=[self, Dimension(descriptor)])
+            return CompositeDimension(numerator=(self, _dimension(descriptor)))
         raise InvalidUnitDescriptorBinaryOperation(
             f"cannot multiply {self} with {descriptor}. "
         )
 
     def __truediv__(self, descriptor: "UnitDescriptor") -> "CompositeDimension":
         if isinstance(descriptor, CompositeDimension):
-            numerator = descriptor.denominator.copy()
-            denominator = descriptor.numerator.copy()
-            numerator.append(self)
-            return CompositeDimension(numerator=numerator, denominator=denominator)
+            return CompositeDimension(
+                numerator=(*descriptor.denominator, self),
+                denominator=descriptor.numerator,
+            )
         elif isinstance(descriptor, Dimension):
-            return CompositeDimension(numerator=[self], denominator=[descriptor])
+            return CompositeDimension(numerator=(self,), denominator=(descriptor,))
         elif isinstance(descriptor, MeasurementUnit):
             return CompositeDimension(
-                numerator=[self], denominator=[Dimension(descriptor)]
+                numerator=(self,), denominator=(_dimension(descriptor),)
             )
         raise InvalidUnitDescriptorBinaryOperation(
             f"cannot divide {self} with  {descriptor}. "
@@ -380,11 +418,12 @@ class Dimension:
             raise InvalidUnitDescriptorBinaryOperation(
                 "power operand `**` is not supported for CompositeDimension. "
             )
-        self.power *= power
-        return self
+        return Dimension(self.unit, self.power * power)
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash((self.unit, self.power)))
+        return self._hash  # type: ignore[return-value]
 
     def __eq__(self, dimension) -> bool:
         if not isinstance(dimension, Dimension):
@@ -395,12 +434,16 @@ class Dimension:
         return "Dimension: " + str(self)
 
     def __str__(self) -> str:
-        if self.power != 1:
-            return "(" + self.unit.value + ") ^ " + str(self.power)
-        return self.unit.value
+        if self._str is None:
+            if self.power != 1:
+                string = "(" + self.unit._value_ + ") ^ " + str(self.power)
+            else:
+                string = self.unit._value_
+            object.__setattr__(self, "_str", string)
+        return self._str  # type: ignore[return-value]
 
 
-@dataclass
+@dataclass(slots=True)
 @implements(GenericUnitDescriptor)
 class GenericCompositeDimension:
     """
@@ -421,29 +464,77 @@ class GenericCompositeDimension:
     generic_molal_volume_dimension = (LengthUnit**3) / AmountUnit
     """
 
-    numerator: List[GenericDimension] = field(default_factory=list)
-    denominator: List[GenericDimension] = field(default_factory=list)
+    numerator: Tuple[GenericDimension, ...] = ()
+    denominator: Tuple[GenericDimension, ...] = ()
+
+    # lazily computed caches
+    _str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _key_sets: Optional[tuple[frozenset, frozenset]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # accept any iterables; stored as tuples so that the cached string and
+        # key sets cannot go stale. Generic dimensions of the same unit type are
+        # merged, so that equal generics have the same form and later operations
+        # work on shorter tuples.
+        self.numerator = tuple(self.numerator)
+        self.denominator = tuple(self.denominator)
+        if not _is_simplified(self.numerator, self.denominator, _unit_type_of):
+            self.simplify()
+
+    def simplify(self) -> None:
+        """
+        Simplify the composite by merging common generic dimensions.
+        e.g.
+        `LengthUnit * LengthUnit * LengthUnit / LengthUnit` becomes
+        `LengthUnit^2`.
+        """
+        self.numerator, self.denominator = _merge_exponents(
+            self.numerator, self.denominator, _unit_type_of, _generic_dimension
+        )
+        self._str = None
+        self._key_sets = None
+
+    @classmethod
+    def product(
+        cls, generics: Iterable[GenericUnitDescriptor]
+    ) -> "GenericCompositeDimension":
+        """
+        Create the product of given generic descriptors, e.g. `product([A, B, C])`
+        is the same as `A * B * C` but builds a single composite.
+        """
+        numerator: List[GenericDimension] = []
+        denominator: List[GenericDimension] = []
+        for generic in generics:
+            if isinstance(generic, GenericCompositeDimension):
+                numerator.extend(generic.numerator)
+                denominator.extend(generic.denominator)
+            elif isinstance(generic, GenericDimension):
+                numerator.append(generic)
+            elif isinstance(generic, MeasurementUnitMeta):
+                numerator.append(_generic_dimension(generic))
+            else:
+                raise InvalidUnitDescriptorBinaryOperation(
+                    f"cannot multiply with {generic}. "
+                )
+        return cls(numerator=numerator, denominator=denominator)
 
     def __mul__(self, generic: GenericUnitDescriptor) -> "GenericCompositeDimension":
-        numerator = self.numerator.copy()
-        denominator = self.denominator.copy()
         if isinstance(generic, GenericCompositeDimension):
-            numerator.extend(generic.numerator)
-            denominator.extend(generic.denominator)
             return GenericCompositeDimension(
-                numerator=numerator, denominator=denominator
+                numerator=(*self.numerator, *generic.numerator),
+                denominator=(*self.denominator, *generic.denominator),
             )
-
         elif isinstance(generic, GenericDimension):
-            numerator.append(generic)
             return GenericCompositeDimension(
-                numerator=numerator, denominator=denominator
+                numerator=(*self.numerator, generic),
+                denominator=self.denominator,
             )
-
-        elif type(generic) == MeasurementUnitType:
-            numerator.append(GenericDimension(generic))
+        elif isinstance(generic, MeasurementUnitMeta):
             return GenericCompositeDimension(
-                numerator=numerator, denominator=denominator
+                numerator=(*self.numerator, _generic_dimension(generic)),
+                denominator=self.denominator,
             )
         raise InvalidUnitDescriptorBinaryOperation(
             f"cannot multiply {self} with {generic}. "
@@ -452,23 +543,20 @@ class GenericCompositeDimension:
     def __truediv__(
         self, generic: GenericUnitDescriptor
     ) -> "GenericCompositeDimension":
-        numerator = self.numerator.copy()
-        denominator = self.denominator.copy()
         if isinstance(generic, GenericCompositeDimension):
-            numerator.extend(generic.denominator)
-            denominator.extend(generic.numerator)
             return GenericCompositeDimension(
-                numerator=numerator, denominator=denominator
+                numerator=(*self.numerator, *generic.denominator),
+                denominator=(*self.denominator, *generic.numerator),
             )
         elif isinstance(generic, GenericDimension):
-            denominator.append(generic)
             return GenericCompositeDimension(
-                numerator=numerator, denominator=denominator
+                numerator=self.numerator,
+                denominator=(*self.denominator, generic),
             )
-        elif type(generic) == MeasurementUnitType:
-            denominator.append(GenericDimension(generic))
+        elif isinstance(generic, MeasurementUnitMeta):
             return GenericCompositeDimension(
-                numerator=numerator, denominator=denominator
+                numerator=self.numerator,
+                denominator=(*self.denominator, _generic_dimension(generic)),
             )
         raise InvalidUnitDescriptorBinaryOperation(
             f"cannot divide {self} with {generic}. "
@@ -477,22 +565,27 @@ class GenericCompositeDimension:
     def __eq__(self, generic) -> bool:
         if not isinstance(generic, GenericCompositeDimension):
             return False
-        return set(self.numerator) == set(generic.numerator) and set(
-            self.denominator
-        ) == set(generic.denominator)
+        return self._key() == generic._key()
+
+    def _key(self) -> tuple[frozenset, frozenset]:
+        """
+        The sets of numerator and denominator dimensions, which define equality;
+        computed once per object.
+        """
+        if self._key_sets is None:
+            self._key_sets = (frozenset(self.numerator), frozenset(self.denominator))
+        return self._key_sets
 
     def __hash__(self) -> int:
         return hash(str(self))
 
     def __str__(self):
-        numerators = " * ".join(sorted([str(n) for n in self.numerator]))
-        denominators = " / ".join(sorted([str(d) for d in self.denominator]))
-        if len(denominators) > 0:
-            denominators = " / " + denominators
-        return numerators + denominators
+        if self._str is None:
+            self._str = _composite_str(self.numerator, self.denominator)
+        return self._str
 
 
-@dataclass
+@dataclass(slots=True)
 @implements(UnitDescriptor)
 class CompositeDimension:
     """
@@ -515,8 +608,27 @@ class CompositeDimension:
 
     Default = TypeVar("Default")  # default return type for `get` functions.
 
-    numerator: List[Dimension] = field(default_factory=list)
-    denominator: List[Dimension] = field(default_factory=list)
+    numerator: Tuple[Dimension, ...] = ()
+    denominator: Tuple[Dimension, ...] = ()
+
+    # lazily computed caches
+    _str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _key_sets: Optional[tuple[frozenset, frozenset]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _generic: Optional[GenericCompositeDimension] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # accept any iterables; stored as tuples so that the cached string and
+        # key sets cannot go stale. Dimensions of the same unit are merged, so
+        # that equal composites have the same form and later operations work on
+        # shorter tuples.
+        self.numerator = tuple(self.numerator)
+        self.denominator = tuple(self.denominator)
+        if not _is_simplified(self.numerator, self.denominator, _unit_of):
+            self.simplify()
 
     @staticmethod
     def from_descriptor(descriptor: UnitDescriptor) -> "CompositeDimension":
@@ -538,10 +650,14 @@ class CompositeDimension:
         return self.to_generic() == generic
 
     def to_generic(self) -> GenericCompositeDimension:
-        return GenericCompositeDimension(
-            numerator=[n.to_generic() for n in self.numerator],
-            denominator=[d.to_generic() for d in self.denominator],
-        )
+        # validating descriptors against generics is frequent, thus the generic is
+        # created once.
+        if self._generic is None:
+            self._generic = GenericCompositeDimension(
+                numerator=tuple(n.to_generic() for n in self.numerator),
+                denominator=tuple(d.to_generic() for d in self.denominator),
+            )
+        return self._generic
 
     def get_numerator(
         self, generic: GenericDimension, default: Optional[Default] = None
@@ -565,61 +681,75 @@ class CompositeDimension:
         e.g.
         `bar^(-2) / K^(-1)` becomes `K / (bar^2)`,
         `Pa * m * Pa / s` becomes `(Pa^2) * m / s`
+
+        Composites are simplified on creation, so this is only needed after
+        assigning to the numerator or the denominator.
         """
-        exponents: dict[MeasurementUnit, float] = {}
-        for n in self.numerator:
-            if n.unit in exponents:
-                exponents[n.unit] += n.power
-            else:
-                exponents[n.unit] = n.power
+        self.numerator, self.denominator = _merge_exponents(
+            self.numerator, self.denominator, _unit_of, _dimension
+        )
+        self._str = None
+        self._key_sets = None
+        self._generic = None
 
-        for d in self.denominator:
-            if d.unit in exponents:
-                exponents[d.unit] -= d.power
+    @classmethod
+    def product(cls, descriptors: Iterable[UnitDescriptor]) -> "CompositeDimension":
+        """
+        Create the product of given descriptors, e.g. `product([a, b, c])` is the
+        same as `a * b * c` but builds a single composite.
+        """
+        numerator: List[Dimension] = []
+        denominator: List[Dimension] = []
+        for descriptor in descriptors:
+            if isinstance(descriptor, CompositeDimension):
+                numerator.extend(descriptor.numerator)
+                denominator.extend(descriptor.denominator)
+            elif isinstance(descriptor, Dimension):
+                numerator.append(descriptor)
+            elif isinstance(descriptor, MeasurementUnit):
+                numerator.append(_dimension(descriptor))
             else:
-                exponents[d.unit] = 0 - d.power
-
-        numerator = []
-        denominator = []
-        for unit, exponent in exponents.items():
-            if exponent > 0:
-                numerator.append(Dimension(unit) ** exponent)
-            elif exponent < 0:
-                denominator.append(Dimension(unit) ** abs(exponent))
-
-        self.numerator = numerator
-        self.denominator = denominator
+                raise InvalidUnitDescriptorBinaryOperation(
+                    f"cannot multiply with {descriptor}. "
+                )
+        return cls(numerator=numerator, denominator=denominator)
 
     def __mul__(self, descriptor: "UnitDescriptor") -> "CompositeDimension":
-        numerator = self.numerator.copy()
-        denominator = self.denominator.copy()
         if isinstance(descriptor, CompositeDimension):
-            numerator.extend(descriptor.numerator)
-            denominator.extend(descriptor.denominator)
-            return CompositeDimension(numerator=numerator, denominator=denominator)
+            return CompositeDimension(
+                numerator=(*self.numerator, *descriptor.numerator),
+                denominator=(*self.denominator, *descriptor.denominator),
+            )
         elif isinstance(descriptor, Dimension):
-            numerator.append(descriptor)
-            return CompositeDimension(numerator=numerator, denominator=denominator)
+            return CompositeDimension(
+                numerator=(*self.numerator, descriptor),
+                denominator=self.denominator,
+            )
         elif isinstance(descriptor, MeasurementUnit):
-            numerator.append(Dimension(descriptor))
-            return CompositeDimension(numerator=numerator, denominator=denominator)
+            return CompositeDimension(
+                numerator=(*self.numerator, _dimension(descriptor)),
+                denominator=self.denominator,
+            )
         raise InvalidUnitDescriptorBinaryOperation(
             f"cannot multiply {self} with {descriptor}. "
         )
 
     def __truediv__(self, descriptor: "UnitDescriptor") -> "CompositeDimension":
-        numerator = self.numerator.copy()
-        denominator = self.denominator.copy()
         if isinstance(descriptor, CompositeDimension):
-            numerator.extend(descriptor.denominator)
-            denominator.extend(descriptor.denominator)
-            return CompositeDimension(numerator=numerator, denominator=denominator)
+            return CompositeDimension(
+                numerator=(*self.numerator, *descriptor.denominator),
+                denominator=(*self.denominator, *descriptor.numerator),
+            )
         elif isinstance(descriptor, Dimension):
-            denominator.append(descriptor)
-            return CompositeDimension(numerator=numerator, denominator=denominator)
+            return CompositeDimension(
+                numerator=self.numerator,
+                denominator=(*self.denominator, descriptor),
+            )
         elif isinstance(descriptor, MeasurementUnit):
-            denominator.append(Dimension(descriptor))
-            return CompositeDimension(numerator=numerator, denominator=denominator)
+            return CompositeDimension(
+                numerator=self.numerator,
+                denominator=(*self.denominator, _dimension(descriptor)),
+            )
         raise InvalidUnitDescriptorBinaryOperation(
             f"cannot divide {self} with {descriptor}. "
         )
@@ -630,13 +760,102 @@ class CompositeDimension:
     def __eq__(self, dimension) -> bool:
         if not isinstance(dimension, CompositeDimension):
             return False
-        return set(self.numerator) == set(dimension.numerator) and set(
-            self.denominator
-        ) == set(dimension.denominator)
+        return self._key() == dimension._key()
+
+    def _key(self) -> tuple[frozenset, frozenset]:
+        """
+        The sets of numerator and denominator dimensions, which define equality;
+        computed once per object.
+        """
+        if self._key_sets is None:
+            self._key_sets = (frozenset(self.numerator), frozenset(self.denominator))
+        return self._key_sets
 
     def __str__(self):
-        numerators = " * ".join(sorted([str(n) for n in self.numerator]))
-        denominators = " / ".join(sorted([str(d) for d in self.denominator]))
-        if len(denominators) > 0:
-            denominators = " / " + denominators
-        return numerators + denominators
+        if self._str is None:
+            self._str = _composite_str(self.numerator, self.denominator)
+        return self._str
+
+
+def _composite_str(numerator: Iterable[object], denominator: Iterable[object]) -> str:
+    """
+    Render a composite in canonical form, that is with the numerator and the
+    denominator dimensions sorted.
+    """
+    numerators = " * ".join(sorted(map(str, numerator)))
+    denominators = " / ".join(sorted(map(str, denominator)))
+    if len(denominators) > 0:
+        denominators = " / " + denominators
+    return numerators + denominators
+
+
+def _merge_exponents(
+    numerator: Iterable[Any],
+    denominator: Iterable[Any],
+    key: Callable[[Any], Any],
+    dimension: Callable[[Any], Any],
+) -> tuple[tuple, tuple]:
+    """
+    Merge the dimensions of a composite that share the same key by summing their
+    exponents; `dimension` creates the 1st power dimension of a key.
+    """
+    exponents: dict[Any, Union[float, int]] = {}
+    for n in numerator:
+        k = key(n)
+        exponents[k] = exponents.get(k, 0) + n.power
+    for d in denominator:
+        k = key(d)
+        exponents[k] = exponents.get(k, 0) - d.power
+
+    numerators = []
+    denominators = []
+    for k, exponent in exponents.items():
+        if exponent == 1:
+            numerators.append(dimension(k))
+        elif exponent == -1:
+            denominators.append(dimension(k))
+        elif exponent > 0:
+            numerators.append(dimension(k) ** exponent)
+        elif exponent < 0:
+            denominators.append(dimension(k) ** abs(exponent))
+    return tuple(numerators), tuple(denominators)
+
+
+def _is_simplified(
+    numerator: tuple, denominator: tuple, key: Callable[[Any], Any]
+) -> bool:
+    """
+    Whether no two dimensions of a composite share the same key and all their
+    exponents are positive.
+    """
+    keys = set()
+    for dimension in (*numerator, *denominator):
+        k = key(dimension)
+        if dimension.power <= 0 or k in keys:
+            return False
+        keys.add(k)
+    return True
+
+
+_unit_of = attrgetter("unit")
+_unit_type_of = attrgetter("unit_type")
+
+# Dimensions to the 1st power, shared by all unit algebra operations; descriptor
+# operations never mutate their operands, so sharing them is safe. `Dimension(unit)`
+# returns the shared instance too.
+_generic_dimensions: dict[MeasurementUnitType, GenericDimension] = dict()
+_dimensions: dict[MeasurementUnit, Dimension] = dict()
+
+
+def _generic_dimension(unit_type: MeasurementUnitType) -> GenericDimension:
+    try:
+        return _generic_dimensions[unit_type]
+    except KeyError:
+        return _generic_dimensions.setdefault(unit_type, GenericDimension(unit_type))
+
+
+def _dimension(unit: MeasurementUnit) -> Dimension:
+    try:
+        return _dimensions[unit]
+    except KeyError:
+        return Dimension(unit)
@@ -1,6 +1,4 @@
-from typing import Iterable
-
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 from crdlib.properties.properties import (
     Temperature,
@@ -15,47 +13,69 @@ from crdlib.properties.properties import (
 from crdlib.chemical_substances.substance import ChemicalSubstance
 
 
-class Component(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Component:
     species: ChemicalSubstance
 
 
+@dataclass(frozen=True, slots=True)
 class MassComponent(Component):
     fraction: MassFraction
 
 
+@dataclass(frozen=True, slots=True)
 class VolumetricComponent(Component):
     fraction: VolumeFraction
 
 
+@dataclass(frozen=True, slots=True)
 class MolecularComponent(Component):
     fraction: MolecularFraction
 
 
-class MassComposition(BaseModel):
-    components: Iterable[MassComponent]
+class _Composition:
+    """
+    Stores the components of a composition as a tuple, so that compositions
+    created from any iterable can be iterated more than once.
+    """
+
+    __slots__ = ()
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "components", tuple(self.components))  # type: ignore
+
+
+@dataclass(frozen=True, slots=True)
+class MassComposition(_Composition):
+    components: tuple[MassComponent, ...]
 
 
-class VolumetricComposition(BaseModel):
-    components: Iterable[VolumetricComponent]
+@dataclass(frozen=True, slots=True)
+class VolumetricComposition(_Composition):
+    components: tuple[VolumetricComponent, ...]
 
 
-class MolecularComposition(BaseModel):
-    components: Iterable[MolecularComponent]
+@dataclass(frozen=True, slots=True)
+class MolecularComposition(_Composition):
+    components: tuple[MolecularComponent, ...]
 
 
-class StreamComposition(BaseModel):
+@dataclass(frozen=True, slots=True)
+class StreamComposition:
     mass: MassComposition
     volumetric: VolumetricComposition
     molecular: MolecularComposition
 
 
-class StreamRate(BaseModel):
+@dataclass(frozen=True, slots=True)
+class StreamRate:
     mass: MassRate
     volumetric: VolumetricRate
     molecular: MolecularRate
 
 
-class Stream(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Stream:
     temperature: Temperature
     pressure: Pressure
     composition: StreamComposition
@@ -1,23 +1,32 @@
-from typing import TypeVar, Protocol
+from typing import TYPE_CHECKING, TypeVar, Protocol
 
 
 P = TypeVar("P")
 
 
-def implements(protocol: Protocol):
-    """
-    Decorate a class to enable mypy to check if it implements the given protocol.
-    """
+if TYPE_CHECKING:
 
-    def wrapper(cls):
-        cls._ = _protocol_implementation_check(protocol)
-        return cls
+    def implements(protocol: Protocol):
+        """
+        Decorate a class to enable mypy to check if it implements the given protocol.
+        """
 
-    return wrapper
+        def wrapper(cls):
+            cls._ = _protocol_implementation_check(protocol)
+            return cls
 
+        return wrapper
 
-def _protocol_implementation_check(protocol: P):
-    def wrapper(self) -> P:
-        return self
+    def _protocol_implementation_check(protocol: P):
+        def wrapper(self) -> P:
+            return self
 
-    return wrapper
+        return wrapper
+
+else:
+
+    def implements(protocol):
+        """
+        No-op at runtime; the protocol check is only meaningful to mypy.
+        """
+        return lambda cls: cls
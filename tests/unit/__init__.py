@@ -1,2 +1,4 @@
+from tests.unit.chemical_reactions import *
 from tests.unit.chemical_substances import *
+from tests.unit.models import *
 from tests.unit.properties import *
@@ -0,0 +1,2 @@
+from tests.unit.chemical_reactions.test_network import *
+from tests.unit.chemical_reactions.test_reaction import *
@@ -0,0 +1,38 @@
+from unittest import TestCase, main
+
+from crdlib.chemical_reactions.network import ChemicalReactionNetwork
+from crdlib.chemical_reactions.reaction import ChemicalReaction
+from crdlib.chemical_substances.predefined import ChemicalSubstances
+from crdlib.chemical_substances.substance import ChemicalReactionFactors
+from crdlib.equations.equation import Factor, Term
+from crdlib.properties.properties import Temperature
+from crdlib.properties.units.units import TemperatureUnit
+from tests.unit.chemical_reactions.test_reaction import water_gas_shift
+
+
+def methane_steam_reforming() -> ChemicalReaction:
+    return ChemicalReaction(
+        ChemicalReactionFactors([ChemicalSubstances["CH4"], ChemicalSubstances["H2O"]]),
+        ChemicalReactionFactors(
+            [ChemicalSubstances["CO"], ChemicalSubstances["H2"] * 3]
+        ),
+        Term(Factor()),
+    )
+
+
+class TestChemicalReactionNetwork(TestCase):
+    def test_equilibrium_constants(self):
+        reactions = [water_gas_shift(), methane_steam_reforming()]
+        temperatures = [
+            Temperature(t, TemperatureUnit.KELVIN) for t in (500, 900, 1100)
+        ]
+        constants = ChemicalReactionNetwork(reactions).equilibrium_constants(
+            temperatures
+        )
+        self.assertEqual(
+            constants, [r.equilibrium_constants(temperatures) for r in reactions]
+        )
+
+
+if __name__ == "__main__":
+    main()
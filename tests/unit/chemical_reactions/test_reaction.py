@@ -0,0 +1,79 @@
+from unittest import TestCase, main
+
+from parameterized import parameterized
+
+from crdlib.chemical_reactions.exceptions import UndefinedThermalCapacityCoefficient
+from crdlib.chemical_reactions.reaction import ChemicalReaction
+from crdlib.chemical_substances.predefined import Atoms, ChemicalSubstances
+from crdlib.chemical_substances.substance import ChemicalReactionFactors
+from crdlib.equations.equation import Factor, Term
+from crdlib.properties.properties import Temperature
+from crdlib.properties.units.units import TemperatureUnit
+
+
+def water_gas_shift() -> ChemicalReaction:
+    return ChemicalReaction(
+        ChemicalReactionFactors([ChemicalSubstances["CO"], ChemicalSubstances["H2O"]]),
+        ChemicalReactionFactors([ChemicalSubstances["CO2"], ChemicalSubstances["H2"]]),
+        Term(Factor()),
+    )
+
+
+class TestChemicalReaction(TestCase):
+    def test_standard_gibbs_free_energy_diff(self):
+        self.assertAlmostEqual(
+            water_gas_shift().standard_gibbs_free_energy_diff(), -28499
+        )
+
+    def test_standard_enthalpy_diff(self):
+        self.assertAlmostEqual(water_gas_shift().standard_enthalpy_diff(), -41160)
+
+    def test_adding_to_factors_does_not_change_reaction(self):
+        reaction = water_gas_shift()
+        reaction.reactants + ChemicalSubstances["CH4"]
+        self.assertEqual(len(reaction.reactants.participants), 2)
+        self.assertAlmostEqual(reaction.standard_enthalpy_diff(), -41160)
+
+    @parameterized.expand([(298.15, 98358), (500, 129.07), (1000, 1.3527)])
+    def test_equilibrium_constant(self, temperature, constant):
+        self.assertAlmostEqual(
+            water_gas_shift().equilibrium_constant(
+                Temperature(temperature, TemperatureUnit.KELVIN)
+            )
+            / constant,
+            1,
+            places=4,
+        )
+
+    def test_equilibrium_constants_match_single_evaluation(self):
+        temperatures = [
+            Temperature(t, TemperatureUnit.KELVIN) for t in (400, 600, 800, 600)
+        ]
+        self.assertEqual(
+            water_gas_shift().equilibrium_constants(temperatures),
+            [water_gas_shift().equilibrium_constant(t) for t in temperatures],
+        )
+
+    def test_equilibrium_constant_without_thermal_capacity_raises(self):
+        reaction = water_gas_shift()
+        reaction.products = reaction.products + (Atoms["C"] << Atoms["H"])
+        with self.assertRaises(UndefinedThermalCapacityCoefficient):
+            ChemicalReaction.calculate_equilibrium_constant(
+                Temperature(500, TemperatureUnit.KELVIN),
+                reaction.reactants,
+                reaction.products,
+            )
+
+    def test_calculate_equilibrium_constant(self):
+        reaction = water_gas_shift()
+        temperature = Temperature(727, TemperatureUnit.CELCIUS)
+        self.assertAlmostEqual(
+            ChemicalReaction.calculate_equilibrium_constant(
+                temperature, reaction.reactants, reaction.products
+            ),
+            reaction.equilibrium_constant(temperature),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,17 +2,28 @@ from unittest import TestCase, main
 
 from parameterized import parameterized
 
-from crdlib.chemical_substances.predefined import Atoms
+from crdlib.chemical_substances.predefined import (
+    Atoms,
+    ATOMS_BY_SYMBOL,
+    ChemicalSubstances,
+    SUBSTANCES_BY_SYMBOL,
+)
 from crdlib.chemical_substances.substance import (
     ChemicalCompound,
+    ChemicalCompoundBuilder,
     ChemicalElement,
     ChemicalReactionFactors,
     ChemicalReactionParticipant,
+    StandardFormationProperties,
 )
 from crdlib.chemical_substances.exceptions import (
+    ChemicalSubstanceSymbolChange,
     InvalidChemicalCompoundComponentBinaryOperation,
     InvalidChemicalReactionFactorBinaryOperation,
 )
+from crdlib.properties.properties import FormationEnthalpy, FormationGibbsFreeEnergy
+from crdlib.properties.units.units import AmountUnit, EnergyUnit, TemperatureUnit
+from crdlib.properties.exceptions import SharedPhysicalPropertyConversion
 
 
 class TestChemicalCompound(TestCase):
@@ -42,6 +53,69 @@ class TestChemicalCompound(TestCase):
             Atoms["C"].atomic_mass + Atoms["O"].atomic_mass * 2,
         )
 
+    def test_compound_from_elements(self):
+        compound = ChemicalCompound.from_elements(
+            [ChemicalElement(Atoms["H"], 2), ChemicalElement(Atoms["O"])], "H2O"
+        )
+        self.assertEqual(compound.symbol, "H2O")
+        self.assertEqual(
+            compound.molecular_weight,
+            Atoms["H"].atomic_mass * 2 + Atoms["O"].atomic_mass,
+        )
+
+    def test_substances_as_keys(self):
+        water = ChemicalCompound([Atoms["H"] * 2, Atoms["O"]], "H2O")
+        same_water = ChemicalCompound([Atoms["O"], Atoms["H"] * 2], "H2O")
+        fractions = {water: 0.4, ChemicalElement(Atoms["H"], 2): 0.6}
+        self.assertEqual(fractions[same_water], 0.4)
+        self.assertEqual(fractions[ChemicalElement(Atoms["H"], 2)], 0.6)
+
+    def test_compounds_without_symbol_compare_composition(self):
+        carbon_monoxide = Atoms["C"] << Atoms["O"]
+        nitrogen = ChemicalCompound([Atoms["N"] * 2])
+        nitrogen.molecular_weight = carbon_monoxide.molecular_weight
+        self.assertNotEqual(carbon_monoxide, nitrogen)
+        self.assertEqual(len({carbon_monoxide, nitrogen}), 2)
+        self.assertEqual(carbon_monoxide, Atoms["O"] << Atoms["C"])
+
+    def test_set_symbol_of_hashed_substance_raises(self):
+        compound = Atoms["Na"] << Atoms["Cl"]
+        compound.set_symbol("NaCl")
+        hash(compound)
+        with self.assertRaises(ChemicalSubstanceSymbolChange):
+            compound.set_symbol("ClNa")
+        self.assertEqual(compound.symbol, "NaCl")
+
+    def test_hash_survives_molecular_weight_change(self):
+        compound = Atoms["Na"] << Atoms["Cl"]
+        compounds = {compound}
+        compound.molecular_weight += 1
+        self.assertIn(compound, compounds)
+
+    def test_bulk_from_elements(self):
+        compounds = ChemicalCompound.bulk_from_elements(
+            [
+                [ChemicalElement(Atoms["H"], 2), ChemicalElement(Atoms["O"])],
+                [ChemicalElement(Atoms["N"], 2)],
+            ]
+        )
+        self.assertEqual(
+            [c.molecular_weight for c in compounds],
+            [
+                Atoms["H"].atomic_mass * 2 + Atoms["O"].atomic_mass,
+                Atoms["N"].atomic_mass * 2,
+            ],
+        )
+
+    def test_compound_from_atoms(self):
+        compound = ChemicalCompound.from_atoms([Atoms["C"], Atoms["O"]], [1, 2])
+        self.assertEqual(len(compound.elements), 2)
+        self.assertIs(compound.elements[1], ChemicalElement.get(Atoms["O"], 2))
+        self.assertEqual(
+            compound.molecular_weight,
+            Atoms["C"].atomic_mass + Atoms["O"].atomic_mass * 2,
+        )
+
 
 invalid_factors = [
     ("float", 1.2),
@@ -58,6 +132,19 @@ class TestChemicalCompoundComponents(TestCase):
         self.assertEqual(elem.atom, Atoms["S"])
         self.assertEqual(elem.number_of_atoms, 2)
 
+    def test_get_element_is_shared(self):
+        self.assertIs(
+            ChemicalElement.get(Atoms["N"], 2), ChemicalElement.get(Atoms["N"], 2)
+        )
+
+    def test_atom_multiplication_creates_new_element(self):
+        self.assertIsNot(Atoms["S"] * 3, Atoms["S"] * 3)
+
+    def test_compounds_from_atoms_share_elements(self):
+        compound1 = Atoms["H"] << Atoms["Cl"]
+        compound2 = Atoms["H"] << Atoms["F"]
+        self.assertIs(compound1.elements[0], compound2.elements[0])
+
     @parameterized.expand(invalid_factors)
     def test_create_invalid_element_from_atom_raises(self, _, factor):
         with self.assertRaises(InvalidChemicalCompoundComponentBinaryOperation):
@@ -147,6 +234,55 @@ class TestChemicalCompoundComponents(TestCase):
         self.assertTrue(ChemicalElement(Atoms["Cl"]) in compound.elements)
         self.assertTrue(ChemicalElement(Atoms["H"]) in compound.elements)
 
+    def test_create_compound_adds_molecular_weights(self):
+        compound = (Atoms["C"] << ChemicalElement(Atoms["H"], 3)) << (
+            ChemicalCompound([Atoms["O"], Atoms["H"]]) << Atoms["C"]
+        )
+        self.assertAlmostEqual(
+            compound.molecular_weight,
+            sum(e.molecular_weight for e in compound.elements),
+        )
+
+    @parameterized.expand(
+        [
+            ("atom", Atoms["Cl"]),
+            ("element", ChemicalElement(Atoms["Cl"])),
+            ("compound", ChemicalCompound([Atoms["Na"], Atoms["O"]])),
+        ]
+    )
+    def test_create_compound_does_not_change_operands(self, _, component):
+        compound = ChemicalCompound([Atoms["Ca"], Atoms["O"]])
+        compound << component
+        component << compound
+        self.assertEqual(len(compound.elements), 2)
+        if isinstance(component, ChemicalCompound):
+            self.assertEqual(len(component.elements), 2)
+
+
+class TestChemicalCompoundBuilder(TestCase):
+    def test_build_compound(self):
+        builder = ChemicalCompoundBuilder()
+        (
+            builder
+            << Atoms["Ca"]
+            << ChemicalElement(Atoms["O"])
+            << ChemicalCompound([Atoms["C"], ChemicalElement(Atoms["O"], 2)])
+        )
+        compound = builder.build("CaCO3")
+        self.assertEqual(compound.symbol, "CaCO3")
+        self.assertEqual(len(compound.elements), 4)
+        self.assertAlmostEqual(
+            compound.molecular_weight,
+            Atoms["Ca"].atomic_mass
+            + Atoms["C"].atomic_mass
+            + Atoms["O"].atomic_mass * 3,
+        )
+
+    @parameterized.expand(invalid_factors)
+    def test_invalid_component_raises(self, _, factor):
+        with self.assertRaises(InvalidChemicalCompoundComponentBinaryOperation):
+            ChemicalCompoundBuilder() << factor
+
 
 class TestChemicalReactionFactors(TestCase):
     def test_element_addition_creates_factors(self):
@@ -154,6 +290,11 @@ class TestChemicalReactionFactors(TestCase):
         self.assertTrue(isinstance(factors, ChemicalReactionFactors))
         self.assertEqual(len(factors.participants), 2)
 
+    def test_element_and_participant_addition_creates_factors(self):
+        factors = ChemicalElement(Atoms["H"], 2) + ChemicalElement(Atoms["O"], 2) * 3
+        self.assertEqual(len(factors.participants), 2)
+        self.assertEqual(factors.participants[1].stoichiometric_coefficient, 3)
+
     @parameterized.expand(invalid_factors)
     def test_invalid_element_addition_raises(self, _, factor):
         with self.assertRaises(InvalidChemicalReactionFactorBinaryOperation):
@@ -168,11 +309,21 @@ class TestChemicalReactionFactors(TestCase):
         with self.assertRaises(InvalidChemicalReactionFactorBinaryOperation):
             ChemicalElement(Atoms["F"]) * factor
 
+    @parameterized.expand(invalid_factors)
+    def test_invalid_participant_multiplication_raises(self, _, factor):
+        with self.assertRaises(InvalidChemicalReactionFactorBinaryOperation):
+            (ChemicalElement(Atoms["F"]) * 2) * factor
+
     def test_factors_multiplication_creates_factors(self):
         factors = ChemicalReactionFactors([ChemicalElement(Atoms["C"])]) * 2
         self.assertTrue(isinstance(factors, ChemicalReactionFactors))
         self.assertEqual(factors.participants[0].stoichiometric_coefficient, 2)
 
+    def test_factors_multiplication_does_not_change_factors(self):
+        factors = ChemicalReactionFactors([ChemicalElement(Atoms["C"]) * 3])
+        factors * 2
+        self.assertEqual(factors.participants[0].stoichiometric_coefficient, 3)
+
     @parameterized.expand(invalid_factors)
     def test_invalid_factors_multiplication_raises(self, _, factor):
         with self.assertRaises(InvalidChemicalReactionFactorBinaryOperation):
@@ -190,11 +341,56 @@ class TestChemicalReactionFactors(TestCase):
         self.assertTrue(factors, ChemicalReactionFactors)
         self.assertEqual(len(factors.participants), 2)
 
+    def test_factors_addition_appends_in_place(self):
+        factors = ChemicalReactionFactors([ChemicalElement(Atoms["Si"])])
+        self.assertIs(factors + ChemicalElement(Atoms["O"]), factors)
+        self.assertEqual(len(factors.participants), 2)
+
+    def test_snapshot_addition_does_not_change_snapshot(self):
+        snapshot = ChemicalReactionFactors([ChemicalElement(Atoms["Si"])]).snapshot()
+        factors = snapshot + ChemicalElement(Atoms["O"])
+        self.assertEqual(len(snapshot.participants), 1)
+        self.assertEqual(len(factors.participants), 2)
+        self.assertEqual(
+            snapshot, ChemicalReactionFactors([ChemicalElement(Atoms["Si"])])
+        )
+
     @parameterized.expand(invalid_factors)
     def test_invalid_factors_addition_raises(self, _, factor):
         with self.assertRaises(InvalidChemicalReactionFactorBinaryOperation):
             ChemicalReactionFactors([ChemicalElement(Atoms["Si"])]) + factor
 
 
+class TestStandardFormationProperties(TestCase):
+    def test_default_standard_temperature_cannot_be_converted_in_place(self):
+        unit = EnergyUnit.JOULE / AmountUnit.MOL
+        properties1, properties2 = (
+            StandardFormationProperties(
+                FormationEnthalpy(0, unit), FormationGibbsFreeEnergy(0, unit)
+            )
+            for _ in range(2)
+        )
+        self.assertIs(properties1.temperature, properties2.temperature)
+        with self.assertRaises(SharedPhysicalPropertyConversion):
+            properties1.temperature.to_unit_(TemperatureUnit.KELVIN)
+        self.assertEqual(
+            properties2.temperature.unit_descriptor, TemperatureUnit.CELCIUS
+        )
+
+
+class TestPredefined(TestCase):
+    def test_get_atom(self):
+        self.assertIs(Atoms.get("Fe"), Atoms["Fe"])
+        self.assertIs(ATOMS_BY_SYMBOL["Fe"], Atoms["Fe"])
+
+    def test_get_substance(self):
+        self.assertIs(ChemicalSubstances.get("CO2"), ChemicalSubstances["CO2"])
+        self.assertIs(SUBSTANCES_BY_SYMBOL["CO2"], ChemicalSubstances["CO2"])
+
+    def test_symbol_views_are_read_only(self):
+        with self.assertRaises(TypeError):
+            ATOMS_BY_SYMBOL["Fe"] = Atoms["H"]  # type: ignore
+
+
 if __name__ == "__main__":
     main()
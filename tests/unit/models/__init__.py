@@ -0,0 +1 @@
+from tests.unit.models.test_balance import *
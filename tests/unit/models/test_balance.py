@@ -0,0 +1,21 @@
+from unittest import TestCase, main
+
+from crdlib.models.balance import MolecularBalanceTerm, EnergyBalanceTerm
+
+
+class TestBalanceTerms(TestCase):
+    def test_terms_of_different_balances_are_not_equal(self):
+        self.assertNotEqual(
+            MolecularBalanceTerm.DIFFUSION, EnergyBalanceTerm.CONDUCTION
+        )
+
+    def test_terms_of_different_balances_are_distinct_keys(self):
+        terms = {
+            MolecularBalanceTerm.ACCUMULATION: 1,
+            EnergyBalanceTerm.ACCUMULATION: 2,
+        }
+        self.assertEqual(len(terms), 2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,4 @@
 from tests.unit.properties.test_properties import *
 from tests.unit.properties.units.test_descriptors import *
+from tests.unit.properties.thermophysical.test_thermal_capacity_coefficient import *
+from tests.unit.properties.units.test_converters import *
@@ -11,17 +11,27 @@ from crdlib.properties.units.units import (
 )
 from crdlib.properties.units.descriptors import Dimension
 from crdlib.properties.properties import (
+    AbstractPhysicalProperty,
     Temperature,
     Pressure,
     Volume,
     Length,
     MassRate,
     MolarEnergy,
+    ThermalCapacity,
+)
+from crdlib.properties.exceptions import (
+    InvalidUnitConversion,
+    UndefinedConverter,
+    SharedPhysicalPropertyConversion,
 )
-from crdlib.properties.exceptions import InvalidUnitConversion
 
 
 class TestPhysicalProperty(TestCase):
+    def test_abstract_physical_property_cannot_be_instantiated(self):
+        with self.assertRaises(TypeError):
+            AbstractPhysicalProperty(0, TemperatureUnit.KELVIN)
+
     def test_to_unit_C_to_K(self):
         C = Temperature(0, TemperatureUnit.CELCIUS)
         K = C.to_unit(TemperatureUnit.KELVIN)
@@ -36,6 +46,49 @@ class TestPhysicalProperty(TestCase):
         with self.assertRaises(InvalidUnitConversion):
             Temperature(0, TemperatureUnit.CELCIUS).to_unit(PressureUnit.BAR)
 
+    def test_to_same_unit(self):
+        C = Temperature(25, TemperatureUnit.CELCIUS)
+        same = C.to_unit(TemperatureUnit.CELCIUS)
+        self.assertIsNot(same, C)
+        self.assertEqual(same.value, 25)
+        self.assertEqual(same.unit_descriptor, TemperatureUnit.CELCIUS)
+
+    def test_to_unit_in_place(self):
+        T = Temperature(0, TemperatureUnit.CELCIUS)
+        self.assertIs(T.to_unit_(TemperatureUnit.KELVIN), T)
+        self.assertEqual(T.value, 273.15)
+        self.assertEqual(T.unit_descriptor, TemperatureUnit.KELVIN)
+
+    def test_to_unit_in_place_from_dimension(self):
+        T = Temperature(0, TemperatureUnit.CELCIUS)
+        T.to_unit_(Dimension(TemperatureUnit.KELVIN))
+        self.assertIs(T.unit_descriptor, TemperatureUnit.KELVIN)
+        self.assertAlmostEqual(T.si_value, 273.15)
+
+    def test_shared_to_unit_in_place_raises(self):
+        T = Temperature(0, TemperatureUnit.CELCIUS).share()
+        with self.assertRaises(SharedPhysicalPropertyConversion):
+            T.to_unit_(TemperatureUnit.KELVIN)
+        self.assertEqual(T.value, 0)
+        self.assertEqual(T.to_unit(TemperatureUnit.KELVIN).value, 273.15)
+
+    def test_to_unit_in_place_raises(self):
+        T = Temperature(0, TemperatureUnit.CELCIUS)
+        with self.assertRaises(InvalidUnitConversion):
+            T.to_unit_(PressureUnit.BAR)
+        self.assertEqual(T.value, 0)
+        self.assertEqual(T.unit_descriptor, TemperatureUnit.CELCIUS)
+
+    def test_convert_values(self):
+        values = Temperature.convert_values(
+            [0, 100], TemperatureUnit.CELCIUS, TemperatureUnit.KELVIN
+        )
+        self.assertEqual(values, [273.15, 373.15])
+
+    def test_convert_values_raises(self):
+        with self.assertRaises(InvalidUnitConversion):
+            Temperature.convert_values([0], TemperatureUnit.CELCIUS, PressureUnit.BAR)
+
     def test_from_physical_property(self):
         K = Temperature(500, TemperatureUnit.KELVIN)
         F = Temperature.from_physical_property(K, TemperatureUnit.FAHRENHEIT)
@@ -53,6 +106,19 @@ class TestPhysicalProperty(TestCase):
         self.assertEqual(m.value, 2)
         self.assertEqual(m.unit_descriptor, LengthUnit.METER)
 
+    def test_si_value(self):
+        F = Temperature(212, TemperatureUnit.FAHRENHEIT)
+        self.assertAlmostEqual(F.si_value, 373.15)
+        self.assertEqual(F.unit_descriptor, TemperatureUnit.FAHRENHEIT)
+
+    def test_si_value_follows_value_and_unit(self):
+        T = Temperature(25, TemperatureUnit.CELCIUS)
+        self.assertAlmostEqual(T.si_value, 298.15)
+        T.value = 100
+        self.assertAlmostEqual(T.si_value, 373.15)
+        T.unit_descriptor = TemperatureUnit.KELVIN
+        self.assertEqual(T.si_value, 100)
+
 
 class TestExponentPhysicalProperty(TestCase):
     def test_to_unit_m3_to_cm3(self):
@@ -103,6 +169,11 @@ class TestAliasedPhysicalProperty(TestCase):
         P2 = P1.to_unit(PressureUnit.PASCAL)
         self.assertEqual(P2.value, 200_000)
 
+    def test_to_unit_bar_to_kPa(self):
+        P1 = Pressure(2, PressureUnit.BAR)
+        P2 = P1.to_unit(PressureUnit.KILO_PASCAL)
+        self.assertEqual(P2.value, 200)
+
     def test_to_unit_kPa_to_psi(self):
         P1 = Pressure(200, PressureUnit.KILO_PASCAL)
         P2 = P1.to_unit(PressureUnit.PSI)
@@ -126,6 +197,12 @@ class TestAliasedPhysicalProperty(TestCase):
         )
         self.assertEqual(P2.value, 200_000)
 
+    def test_to_base_units_from_different_units(self):
+        self.assertEqual(Pressure(2, PressureUnit.BAR).to_base_units().value, 200_000)
+        self.assertEqual(
+            Pressure(2, PressureUnit.KILO_PASCAL).to_base_units().value, 2_000
+        )
+
 
 class TestAliasedCompositePhysicalProperty(TestCase):
     def test_to_base_units_composite_value(self):
@@ -133,6 +210,11 @@ class TestAliasedCompositePhysicalProperty(TestCase):
 
         self.assertEqual(E.to_base_units().value, 10_000)
 
+    def test_si_value(self):
+        E = MolarEnergy(-241.829, EnergyUnit.KILO_JOULE / AmountUnit.MOL)
+
+        self.assertAlmostEqual(E.si_value, -241_829)
+
     def test_to_base_units_composite_dimensions(self):
         E = MolarEnergy(10, EnergyUnit.KILO_CALORIE / AmountUnit.KILO_MOL)
 
@@ -144,6 +226,13 @@ class TestAliasedCompositePhysicalProperty(TestCase):
             / AmountUnit.MOL,
         )
 
+    def test_to_unit_without_converter_raises(self):
+        Cp = ThermalCapacity(
+            1, EnergyUnit.KILO_JOULE / AmountUnit.MOL / TemperatureUnit.KELVIN
+        )
+        with self.assertRaises(UndefinedConverter):
+            Cp.to_unit(EnergyUnit.JOULE / AmountUnit.MOL / TemperatureUnit.KELVIN)
+
 
 if __name__ == "__main__":
     main()
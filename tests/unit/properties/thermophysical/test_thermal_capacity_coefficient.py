@@ -0,0 +1,41 @@
+from unittest import TestCase, main
+
+from crdlib.properties.thermophysical.thermal_capacity_coefficient import (
+    COEFFICIENTS_BY_SYMBOL,
+    ThermalCapacityCoefficients,
+)
+
+
+class TestThermalCapacityCoefficient(TestCase):
+    def test_evaluate(self):
+        cp = ThermalCapacityCoefficients["CO2"].evaluate(500)
+        self.assertAlmostEqual(cp, 10.34 + 0.00274 * 500 - 195500 / 500**2)
+
+    def test_evaluate_with_quadratic_term(self):
+        cp = ThermalCapacityCoefficients["H2O"].evaluate(1000)
+        self.assertAlmostEqual(cp, 8.22 + 0.00015 * 1000 + 0.00000134 * 1000**2)
+
+    def test_evaluate_many(self):
+        coefficient = ThermalCapacityCoefficients["CaCO3"]
+        self.assertEqual(
+            coefficient.evaluate_many([300, 600]),
+            [coefficient.evaluate(300), coefficient.evaluate(600)],
+        )
+
+    def test_evaluate_all(self):
+        capacities = ThermalCapacityCoefficients.evaluate_all(500)
+        self.assertEqual(len(capacities), len(ThermalCapacityCoefficients))
+        self.assertEqual(
+            capacities["CH4"], ThermalCapacityCoefficients["CH4"].evaluate(500)
+        )
+
+    def test_coefficients_by_symbol(self):
+        self.assertIs(
+            COEFFICIENTS_BY_SYMBOL["CO"], ThermalCapacityCoefficients.get("CO")
+        )
+        with self.assertRaises(TypeError):
+            COEFFICIENTS_BY_SYMBOL["CO"] = None  # type: ignore
+
+
+if __name__ == "__main__":
+    main()
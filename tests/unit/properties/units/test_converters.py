@@ -0,0 +1,188 @@
+from unittest import TestCase, main
+
+from parameterized import parameterized
+
+from crdlib.properties.units.units import (
+    PressureUnit,
+    TemperatureUnit,
+    LengthUnit,
+    EnergyUnit,
+    MassUnit,
+    TimeUnit,
+    AmountUnit,
+)
+from crdlib.properties.units.descriptors import Dimension
+from crdlib.properties.units.converters import (
+    AliasedPressureUnitConverter,
+    TemperatureUnitConverter,
+    LengthUnitConverter,
+    EnergyUnitConverter,
+    MassRateUnitConverter,
+    GasConstantUnitConverter,
+    MolarVolumeUnitConverter,
+    get_converter,
+)
+from crdlib.properties.exceptions import InvalidUnitConversion
+
+
+class TestAliasedPressureUnitConverter(TestCase):
+    @parameterized.expand(
+        [
+            (PressureUnit.BAR, PressureUnit.BAR, 1),
+            (PressureUnit.PASCAL, PressureUnit.BAR, 1e-5),
+            (PressureUnit.KILO_PASCAL, PressureUnit.BAR, 1e-2),
+            (PressureUnit.MILLI_BAR, PressureUnit.PASCAL, 100),
+            (PressureUnit.PSI, PressureUnit.BAR, 1 / 14.5038),
+            (PressureUnit.KILO_PASCAL, PressureUnit.PASCAL, 1_000),
+        ]
+    )
+    def test_get_factor(self, from_unit, to_unit, factor):
+        self.assertAlmostEqual(
+            AliasedPressureUnitConverter.get_factor(from_unit, to_unit), factor
+        )
+
+    def test_converter_for(self):
+        to_pascal = AliasedPressureUnitConverter.converter_for(
+            PressureUnit.BAR, PressureUnit.PASCAL
+        )
+        self.assertEqual(to_pascal(2), 200_000)
+
+    def test_get_factor_raises(self):
+        with self.assertRaises(InvalidUnitConversion):
+            AliasedPressureUnitConverter.get_factor(
+                PressureUnit.BAR, TemperatureUnit.KELVIN
+            )
+
+
+class TestLengthUnitConverter(TestCase):
+    @parameterized.expand(
+        [
+            (LengthUnit.METER, LengthUnit.MILLI_METER, 1_000),
+            (LengthUnit.KILO_METER, LengthUnit.CENTI_METER, 100_000),
+            (LengthUnit.FOOT, LengthUnit.INCH, 39.37 / 3.281),
+        ]
+    )
+    def test_get_factor(self, from_unit, to_unit, factor):
+        self.assertAlmostEqual(
+            LengthUnitConverter.get_factor(from_unit, to_unit), factor
+        )
+
+    def test_get_factor_raises(self):
+        with self.assertRaises(InvalidUnitConversion):
+            LengthUnitConverter.get_factor(LengthUnit.METER, EnergyUnit.JOULE)
+
+    def test_convert_to_same_unit_is_exact(self):
+        self.assertEqual(
+            LengthUnitConverter.convert(7.5, LengthUnit.FOOT, LengthUnit.FOOT), 7.5
+        )
+
+
+class TestEnergyUnitConverter(TestCase):
+    @parameterized.expand(
+        [
+            (EnergyUnit.KILO_JOULE, EnergyUnit.JOULE, 1_000),
+            (EnergyUnit.JOULE, EnergyUnit.GIGA_JOULE, 1e-9),
+            (EnergyUnit.BTU, EnergyUnit.JOULE, 1055),
+            (EnergyUnit.KILO_CALORIE, EnergyUnit.CALORIE, 1_000),
+        ]
+    )
+    def test_get_factor(self, from_unit, to_unit, factor):
+        self.assertAlmostEqual(
+            EnergyUnitConverter.get_factor(from_unit, to_unit), factor
+        )
+
+
+class TestGetConverter(TestCase):
+    def test_get_converter_of_equivalent_generics(self):
+        generic = (
+            (AmountUnit**-1)
+            * (TemperatureUnit**-1)
+            * LengthUnit
+            * MassUnit
+            * LengthUnit
+            / TimeUnit
+            / TimeUnit
+        )
+        self.assertIs(get_converter(generic), GasConstantUnitConverter)
+
+
+class TestCompositeUnitConverter(TestCase):
+    def test_get_factor_after_dimension_changes(self):
+        from_unit = MassUnit.KILO_GRAM / TimeUnit.SECOND
+        to_unit = MassUnit.GRAM / TimeUnit.SECOND
+        self.assertAlmostEqual(
+            MassRateUnitConverter.get_factor(from_unit, to_unit), 1e3
+        )
+        from_unit.denominator = (Dimension(TimeUnit.MINUTE),)
+        self.assertAlmostEqual(
+            MassRateUnitConverter.get_factor(from_unit, to_unit), 1e3 / 60
+        )
+
+    def test_convert_to_same_unit(self):
+        unit = MassUnit.POUND / TimeUnit.HOUR
+        self.assertEqual(MassRateUnitConverter.convert(2.5, unit, unit), 2.5)
+
+    def test_get_factor_applies_dimension_powers(self):
+        self.assertAlmostEqual(
+            MolarVolumeUnitConverter.get_factor(
+                (LengthUnit.METER**3) / AmountUnit.MOL,
+                (LengthUnit.CENTI_METER**3) / AmountUnit.MOL,
+            ),
+            1e6,
+        )
+        self.assertAlmostEqual(
+            MassRateUnitConverter.get_factor(
+                MassUnit.GRAM / (TimeUnit.MINUTE**2),
+                MassUnit.GRAM / (TimeUnit.SECOND**2),
+            ),
+            1 / 3_600,
+        )
+
+    def test_get_factor_of_equal_dimensions(self):
+        factor = MassRateUnitConverter.get_factor(
+            MassUnit.KILO_GRAM / TimeUnit.MINUTE, MassUnit.GRAM / TimeUnit.SECOND
+        )
+        self.assertAlmostEqual(factor, 1_000 / 60)
+        self.assertEqual(
+            MassRateUnitConverter.get_factor(
+                MassUnit.KILO_GRAM / TimeUnit.MINUTE, MassUnit.GRAM / TimeUnit.SECOND
+            ),
+            factor,
+        )
+
+
+class TestTemperatureUnitConverter(TestCase):
+    @parameterized.expand(
+        [
+            (TemperatureUnit.KELVIN, TemperatureUnit.CELCIUS, 300, 26.85),
+            (TemperatureUnit.CELCIUS, TemperatureUnit.FAHRENHEIT, 100, 212),
+            (TemperatureUnit.FAHRENHEIT, TemperatureUnit.KELVIN, 32, 273.15),
+            (TemperatureUnit.RANKINE, TemperatureUnit.FAHRENHEIT, 491.67, 32),
+        ]
+    )
+    def test_convert(self, from_unit, to_unit, value, expected):
+        self.assertAlmostEqual(
+            TemperatureUnitConverter.convert(value, from_unit, to_unit), expected
+        )
+
+    def test_converter_for(self):
+        to_kelvin = TemperatureUnitConverter.converter_for(
+            TemperatureUnit.CELCIUS, TemperatureUnit.KELVIN
+        )
+        self.assertEqual([to_kelvin(0), to_kelvin(100)], [273.15, 373.15])
+
+    def test_converter_for_raises(self):
+        with self.assertRaises(InvalidUnitConversion):
+            TemperatureUnitConverter.converter_for(
+                PressureUnit.BAR, TemperatureUnit.KELVIN
+            )
+
+    def test_convert_raises(self):
+        with self.assertRaises(InvalidUnitConversion):
+            TemperatureUnitConverter.convert(
+                1, TemperatureUnit.KELVIN, PressureUnit.BAR
+            )
+
+
+if __name__ == "__main__":
+    main()
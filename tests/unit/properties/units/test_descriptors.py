@@ -1,3 +1,4 @@
+from dataclasses import FrozenInstanceError
 from unittest import TestCase, main
 from typing import Type
 
@@ -10,10 +11,12 @@ from crdlib.properties.units.units import (
     LengthUnit,
     MassUnit,
     TimeUnit,
+    AmountUnit,
 )
 from crdlib.properties.units.descriptors import (
     Dimension,
     CompositeDimension,
+    GenericCompositeDimension,
     GenericDimension,
 )
 from crdlib.properties.exceptions import InvalidUnitDescriptorBinaryOperation
@@ -38,6 +41,21 @@ class TestDimensions(TestUnitDescriptors):
             self.create(TemperatureUnit.CELCIUS) == self.create(TemperatureUnit.RANKINE)
         )
 
+    def test_first_power_dimension_is_interned(self):
+        self.assertIs(Dimension(PressureUnit.BAR), Dimension(PressureUnit.BAR))
+        self.assertIsNot(Dimension(PressureUnit.BAR, 2), Dimension(PressureUnit.BAR, 2))
+
+    def test_interned_dimension_cannot_be_changed(self):
+        dimension = Dimension(MassUnit.GRAM)
+        with self.assertRaises(FrozenInstanceError):
+            dimension.power = 2  # type: ignore[misc]
+        self.assertEqual(Dimension(MassUnit.GRAM).power, 1)
+
+    def test_equal_dimensions_hash_equal(self):
+        self.assertEqual(
+            hash(Dimension(LengthUnit.METER, 3)), hash(Dimension(LengthUnit.METER) ** 3)
+        )
+
     def test_composite_eq(self):
         c1 = self.create(TemperatureUnit.KELVIN) * self.create(PressureUnit.BAR)
         c2 = self.create(PressureUnit.BAR) * self.create(TemperatureUnit.KELVIN)
@@ -95,6 +113,12 @@ class TestDimensions(TestUnitDescriptors):
         self.assertEqual(str(dimension), "(K) ^ 3")
         self.assertEqual(dimension.power, 3)
 
+    def test_power_does_not_mutate(self):
+        dimension = self.create(TemperatureUnit.KELVIN)
+        dimension**2
+        self.assertEqual(Dimension.from_descriptor(dimension).power, 1)
+        self.assertEqual(str(self.create(TemperatureUnit.KELVIN)), "K")
+
     def test_multiple_operations(self):
         composite = (
             self.create(TemperatureUnit.KELVIN) ** 1.5
@@ -176,11 +200,38 @@ class TestCompositeDimension(TestUnitDescriptors):
         return descriptor
 
     def assertDimensions(
-        self, dimensions: list[Dimension], units: list[MeasurementUnit | Dimension]
+        self,
+        dimensions: tuple[Dimension, ...],
+        units: list[MeasurementUnit | Dimension],
     ) -> None:
-        units = list(map(self._to_dimension, units))
+        units = tuple(map(self._to_dimension, units))
         self.assertEqual(dimensions, units)
 
+    def test_division_by_composite(self):
+        composite = (LengthUnit.METER / TimeUnit.SECOND) / (
+            MassUnit.GRAM / PressureUnit.BAR
+        )
+        self.assertEqual(str(composite), "bar * m / g / s")
+
+    def test_product(self):
+        composite = CompositeDimension.product(
+            [
+                LengthUnit.METER,
+                TimeUnit.SECOND**2,
+                MassUnit.GRAM / PressureUnit.BAR,
+            ]
+        )
+        self.assertEqual(
+            composite,
+            LengthUnit.METER
+            * (TimeUnit.SECOND**2)
+            * (MassUnit.GRAM / PressureUnit.BAR),
+        )
+
+    def test_product_raises(self):
+        with self.assertRaises(InvalidUnitDescriptorBinaryOperation):
+            CompositeDimension.product([LengthUnit.METER, 2])
+
     def test_get_numerator(self):
         dimension = self.composite().get_numerator(LengthUnit**2)
         self.assertIsNotNone(dimension)
@@ -205,8 +256,30 @@ class TestCompositeDimension(TestUnitDescriptors):
         composite = self.create_composite([LengthUnit.METER], [LengthUnit.METER])
         composite.simplify()
 
-        self.assertEqual(composite.numerator, [])
-        self.assertEqual(composite.denominator, [])
+        self.assertEqual(composite.numerator, ())
+        self.assertEqual(composite.denominator, ())
+
+    def test_simplify_updates_str(self):
+        composite = LengthUnit.METER * TimeUnit.SECOND
+        self.assertEqual(str(composite), "m * s")
+        composite.denominator = (Dimension(TimeUnit.SECOND),)
+        composite.simplify()
+
+        self.assertEqual(str(composite), "m")
+
+    def test_composites_with_different_powers_are_not_equal(self):
+        self.assertNotEqual(
+            LengthUnit.METER * LengthUnit.METER * TimeUnit.SECOND,
+            LengthUnit.METER * TimeUnit.SECOND * TimeUnit.SECOND,
+        )
+
+    def test_composite_is_simplified_on_creation(self):
+        composite = (
+            LengthUnit.METER * LengthUnit.METER * TimeUnit.SECOND / TimeUnit.SECOND
+        )
+
+        self.assertDimensions(composite.numerator, [LengthUnit.METER**2])
+        self.assertEqual(composite.denominator, ())
 
     def test_simplify_simple_dimensions(self):
         composite = self.create_composite(
@@ -214,7 +287,7 @@ class TestCompositeDimension(TestUnitDescriptors):
         )
         composite.simplify()
 
-        self.assertEqual(composite.denominator, [])
+        self.assertEqual(composite.denominator, ())
         self.assertDimensions(composite.numerator, [LengthUnit.METER])
 
     def test_simplify_exponent_dimensions(self):
@@ -223,7 +296,7 @@ class TestCompositeDimension(TestUnitDescriptors):
         )
         composite.simplify()
 
-        self.assertEqual(composite.denominator, [])
+        self.assertEqual(composite.denominator, ())
         self.assertDimensions(composite.numerator, [TemperatureUnit.KELVIN])
 
     def test_simplify_same_numerator_dimensions(self):
@@ -232,7 +305,7 @@ class TestCompositeDimension(TestUnitDescriptors):
         )
         composite.simplify()
 
-        self.assertEqual(composite.numerator, [TimeUnit.SECOND**2])
+        self.assertEqual(composite.numerator, (TimeUnit.SECOND**2,))
         self.assertDimensions(composite.denominator, [TemperatureUnit.RANKINE])
 
     def test_simplify_same_denominator_dimensions(self):
@@ -242,7 +315,7 @@ class TestCompositeDimension(TestUnitDescriptors):
         composite.simplify()
 
         self.assertDimensions(composite.numerator, [LengthUnit.FOOT])
-        self.assertEqual(composite.denominator, [MassUnit.GRAM**2])
+        self.assertEqual(composite.denominator, (MassUnit.GRAM**2,))
 
     def test_simplify_aliased_composite_dimension_is_not_converted(self):
         composite = self.create_composite(
@@ -268,14 +341,14 @@ class TestCompositeDimension(TestUnitDescriptors):
         composite.simplify()
 
         self.assertDimensions(composite.numerator, [LengthUnit.FOOT])
-        self.assertEqual(composite.denominator, [])
+        self.assertEqual(composite.denominator, ())
 
     def test_simplify_negative_exponent(self):
         composite = self.create_composite([], [PressureUnit.BAR ** (-1)])
         composite.simplify()
 
         self.assertDimensions(composite.numerator, [PressureUnit.BAR])
-        self.assertEqual(composite.denominator, [])
+        self.assertEqual(composite.denominator, ())
 
 
 class TestGenericUnitDescriptors(TestCase):
@@ -290,6 +363,11 @@ class TestGenericDimensions(TestGenericUnitDescriptors):
     def test_generic_eq(self):
         self.assertTrue(self.create(LengthUnit) == self.create(LengthUnit))
 
+    def test_equal_generics_hash_equal(self):
+        self.assertEqual(
+            hash(GenericDimension(LengthUnit, 3)), hash(self.create(LengthUnit) ** 3)
+        )
+
     def test_generic_ne(self):
         self.assertFalse(self.create(LengthUnit) == self.create(MassUnit))
 
@@ -309,6 +387,33 @@ class TestGenericDimensions(TestGenericUnitDescriptors):
         )
         self.assertEqual(len(generic.numerator), 3)
 
+    def test_generic_product(self):
+        generic = GenericCompositeDimension.product(
+            [
+                self.create(TemperatureUnit),
+                self.create(MassUnit) / self.create(TimeUnit),
+                self.create(LengthUnit),
+            ]
+        )
+        self.assertEqual(
+            generic,
+            self.create(TemperatureUnit)
+            * (self.create(MassUnit) / self.create(TimeUnit))
+            * self.create(LengthUnit),
+        )
+
+    def test_generic_composite_is_simplified_on_creation(self):
+        generic = (
+            self.create(LengthUnit) * self.create(LengthUnit) * self.create(LengthUnit)
+        ) / self.create(LengthUnit)
+        self.assertEqual(generic.numerator, (self.create(LengthUnit) ** 2,))
+        self.assertEqual(generic.denominator, ())
+
+    def test_generic_composite_negative_power_is_a_divisor(self):
+        generic = (self.create(AmountUnit) ** -1) * self.create(MassUnit)
+        self.assertEqual(generic, self.create(MassUnit) / self.create(AmountUnit))
+        self.assertEqual(hash(generic), hash(self.create(MassUnit) / AmountUnit))
+
     @parameterized.expand([(None,), (0,), (str(),), (object(),)])
     def test_generic_multiplication_raises(self, factor):
         with self.assertRaises(InvalidUnitDescriptorBinaryOperation):
@@ -337,6 +442,11 @@ class TestGenericDimensions(TestGenericUnitDescriptors):
         generic = self.create(LengthUnit) ** 3
         self.assertEqual(generic.power, 3)
 
+    def test_generic_power_does_not_mutate(self):
+        generic = self.create(LengthUnit)
+        (generic**3) * self.create(MassUnit)
+        self.assertEqual((self.create(LengthUnit) * MassUnit).numerator[0].power, 1)
+
     def test_generic_multiple_operations(self):
         generic = ((self.create(LengthUnit) ** 3) * self.create(TemperatureUnit)) / (
             self.create(MassUnit) * (self.create(PressureUnit) ** 2)